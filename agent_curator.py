@@ -88,8 +88,8 @@ def agent_curator(topic: str, count: int = 3, style: str = "mixed"):
 
     for i, block in enumerate(article_blocks[1:], 1):  # Skip first empty split
         try:
-            # Extract title
-            title_match = re.search(r'Article Title: (.+)', block)
+            # Extract title (the rest of the "ARTICLE N:" header line)
+            title_match = re.match(r'[ \t]*([^\n]*\S)', block)
             title = title_match.group(1).strip() if title_match else f"{topic} Article {i}"
 
             # Extract URL
@@ -6,6 +6,8 @@ Falls back to template-based generation if no API key is configured.
 import os
 from typing import Optional, Literal
 from article_fetcher import Article
+from llm_clients import banned_char_logit_bias, cached_system, log_cache_usage
+from prompts import AI_SYSTEM_PROMPT
 
 
 def get_api_provider() -> Optional[Literal["claude", "openai"]]:
@@ -24,6 +26,26 @@ def get_api_provider() -> Optional[Literal["claude", "openai"]]:
     return None
 
 
+def _format_articles(articles: list[Article]) -> str:
+    """Format the fetched articles as the prompt's article listing."""
+    sections = []
+    for i, article in enumerate(articles, 1):
+        # Truncate article text if too long (model context limits)
+        text_preview = article.text[:3000] + "..." if len(article.text) > 3000 else article.text
+        sections.append(f"""
+ARTICLE {i}:
+Title: {article.title}
+URL: {article.url}
+Word count: {article.word_count()}
+
+Content preview:
+{text_preview}
+
+---
+""")
+    return "".join(sections)
+
+
 def generate_with_claude(articles: list[Article], mode: str = "personal_experience") -> str:
     """
     Generate approval pack using Claude API.
@@ -46,98 +68,11 @@ def generate_with_claude(articles: list[Article], mode: str = "personal_experien
 
     client = anthropic.Anthropic(api_key=api_key)
 
-    # Select appropriate system prompt based on mode
-    if mode == "personal_experience":
-        from prompts import PERSONAL_EXPERIENCE_SYSTEM_PROMPT
-        system_prompt = PERSONAL_EXPERIENCE_SYSTEM_PROMPT
-    else:
-        from prompts import AI_SYSTEM_PROMPT
-        system_prompt = AI_SYSTEM_PROMPT
-
-    # Prepare article summaries for Claude
-    articles_text = ""
-    for i, article in enumerate(articles, 1):
-        # Truncate article text if too long (Claude has token limits)
-        text_preview = article.text[:3000] + "..." if len(article.text) > 3000 else article.text
-        articles_text += f"""
-ARTICLE {i}:
-Title: {article.title}
-URL: {article.url}
-Word count: {article.word_count()}
-
-Content preview:
-{text_preview}
-
----
-"""
+    # Every mode shares the curator prompt: downstream parsers split the pack
+    # on plain "LINKEDIN POST:" headers
+    system_prompt = AI_SYSTEM_PROMPT
 
-    system_prompt = """You are an expert AI content curator for LinkedIn. Your task is to analyze AI-related articles and generate approval packs with multiple post options.
-
-CRITICAL REQUIREMENT: You MUST select and generate approval packs for EXACTLY 5 articles total.
-Include a mix of technical and non-technical articles for variety (aim for 2-3 technical, 2-3 general/non-technical).
-
-SELECTION RULES:
-- Prefer substance over hype
-- Prefer original sources over reposts
-- Avoid repetitive topics (e.g., generic "AI will change everything")
-- Choose something that adds insight for professionals
-- Select exactly 5 articles total (mix of technical and general/non-technical)
-
-LINKEDIN POST RULES:
-- Sound like a real person, not a news bot
-- No emojis
-- No hashtags unless they add real value (max 2)
-- Avoid marketing language
-- Professional and clear tone
-- Length: 3-10 lines depending on content value (not rigid)
-  * Quick news: 3-5 lines
-  * In-depth insights: 6-10 lines if content is truly valuable
-- Engaging hook to grab attention
-- Key insight or takeaway
-- Include specific details and context
-- IMPORTANT: MUST include the actual article URL at the end (use the exact URL provided in the article data above)
-- Write as if you're sharing something valuable with your network
-- Make it worth reading regardless of length
-
-OUTPUT FORMAT (STRICT):
-You MUST produce exactly 5 articles total. Number them ARTICLE 1 through ARTICLE 5.
-For each selected article, produce:
-
-ARTICLE [Number]: [Article Title]
-Article Title: [exact title]
-Article URL: [exact URL]
-
-ARTICLE SUMMARY:
-[4-6 detailed bullet points explaining what the article is about]
-• Point 1
-• Point 2
-• Point 3
-• Point 4
-
-WHY THIS MATTERS:
-[2-3 sentences explaining the significance and professional value]
-
-LINKEDIN POST:
-[A concise 3-5 line LinkedIn post that includes:
-- Engaging hook or opening
-- Key insight from the article (1-2 lines)
-- Why it matters or takeaway (1 line)
-- REQUIRED: The actual article URL at the end (use the exact URL from the article data provided above)]
-- Keep it under the "see more" cutoff for maximum engagement]
-
-[Repeat for ARTICLE 2, ARTICLE 3, ARTICLE 4, and ARTICLE 5 - all 5 articles are REQUIRED]
-
-IMPORTANT:
-- Do NOT mention AI, models, or how you selected the article
-- Do NOT invent facts, quotes, or claims - only use information from the article
-- Verify all claims against the provided article content
-- If unsure about a fact, omit it rather than guess
-- Do NOT exaggerate or hype up the content
-- The ARTICLE SUMMARY and WHY THIS MATTERS are for the user's understanding
-- The LINKEDIN POST is what actually gets posted
-- Make each post unique, insightful, and professional
-- You MUST generate exactly 5 articles - no more, no less
-"""
+    articles_text = _format_articles(articles)
 
     user_message = f"""MUST SELECT EXACTLY 5 ARTICLES FROM THESE {len(articles)} ARTICLES.
 
@@ -174,7 +109,8 @@ Do NOT stop at 3 articles - all 5 are required."""
         model="claude-3-5-sonnet-20241022",
         max_tokens=6000,  # Increased to accommodate 10 articles
         temperature=0.7,
-        system=system_prompt,
+        # Static system prompt first and cached; article data goes in the user turn
+        system=cached_system(system_prompt),
         messages=[
             {
                 "role": "user",
@@ -183,6 +119,8 @@ Do NOT stop at 3 articles - all 5 are required."""
         ]
     )
 
+    log_cache_usage(message)
+
     approval_pack = message.content[0].text
 
     # Validate that we got 5 articles
@@ -218,98 +156,11 @@ def generate_with_openai(articles: list[Article], mode: str = "personal_experien
 
     client = openai.OpenAI(api_key=api_key)
 
-    # Select appropriate system prompt based on mode
-    if mode == "personal_experience":
-        from prompts import PERSONAL_EXPERIENCE_SYSTEM_PROMPT
-        system_prompt = PERSONAL_EXPERIENCE_SYSTEM_PROMPT
-    else:
-        from prompts import AI_SYSTEM_PROMPT
-        system_prompt = AI_SYSTEM_PROMPT
-
-    # Prepare article summaries for GPT
-    articles_text = ""
-    for i, article in enumerate(articles, 1):
-        # Truncate article text if too long
-        text_preview = article.text[:3000] + "..." if len(article.text) > 3000 else article.text
-        articles_text += f"""
-ARTICLE {i}:
-Title: {article.title}
-URL: {article.url}
-Word count: {article.word_count()}
-
-Content preview:
-{text_preview}
+    # Every mode shares the curator prompt: downstream parsers split the pack
+    # on plain "LINKEDIN POST:" headers
+    system_prompt = AI_SYSTEM_PROMPT
 
----
-"""
-
-    system_prompt = """You are an expert AI content curator for LinkedIn. Your task is to analyze AI-related articles and generate approval packs with multiple post options.
-
-CRITICAL REQUIREMENT: You MUST select and generate approval packs for EXACTLY 5 articles total.
-Include a mix of technical and non-technical articles for variety (aim for 2-3 technical, 2-3 general/non-technical).
-
-SELECTION RULES:
-- Prefer substance over hype
-- Prefer original sources over reposts
-- Avoid repetitive topics (e.g., generic "AI will change everything")
-- Choose something that adds insight for professionals
-- Select exactly 5 articles total (mix of technical and general/non-technical)
-
-LINKEDIN POST RULES:
-- Sound like a real person, not a news bot
-- No emojis
-- No hashtags unless they add real value (max 2)
-- Avoid marketing language
-- Professional and clear tone
-- Length: 3-10 lines depending on content value (not rigid)
-  * Quick news: 3-5 lines
-  * In-depth insights: 6-10 lines if content is truly valuable
-- Engaging hook to grab attention
-- Key insight or takeaway
-- Include specific details and context
-- IMPORTANT: MUST include the actual article URL at the end (use the exact URL provided in the article data above)
-- Write as if you're sharing something valuable with your network
-- Make it worth reading regardless of length
-
-OUTPUT FORMAT (STRICT):
-You MUST produce exactly 5 articles total. Number them ARTICLE 1 through ARTICLE 5.
-For each selected article, produce:
-
-ARTICLE [Number]: [Article Title]
-Article Title: [exact title]
-Article URL: [exact URL]
-
-ARTICLE SUMMARY:
-[4-6 detailed bullet points explaining what the article is about]
-• Point 1
-• Point 2
-• Point 3
-• Point 4
-
-WHY THIS MATTERS:
-[2-3 sentences explaining the significance and professional value]
-
-LINKEDIN POST:
-[A concise 3-5 line LinkedIn post that includes:
-- Engaging hook or opening
-- Key insight from the article (1-2 lines)
-- Why it matters or takeaway (1 line)
-- REQUIRED: The actual article URL at the end (use the exact URL from the article data provided above)]
-- Keep it under the "see more" cutoff for maximum engagement]
-
-[Repeat for ARTICLE 2, ARTICLE 3, ARTICLE 4, and ARTICLE 5 - all 5 articles are REQUIRED]
-
-IMPORTANT:
-- Do NOT mention AI, models, or how you selected the article
-- Do NOT invent facts, quotes, or claims - only use information from the article
-- Verify all claims against the provided article content
-- If unsure about a fact, omit it rather than guess
-- Do NOT exaggerate or hype up the content
-- The ARTICLE SUMMARY and WHY THIS MATTERS are for the user's understanding
-- The LINKEDIN POST is what actually gets posted
-- Make each post unique, insightful, and professional
-- You MUST generate exactly 5 articles - no more, no less
-"""
+    articles_text = _format_articles(articles)
 
     user_message = f"""MUST SELECT EXACTLY 5 ARTICLES FROM THESE {len(articles)} ARTICLES.
 
@@ -346,6 +197,7 @@ Do NOT stop at 3 articles - all 5 are required."""
         model="gpt-4o",
         max_tokens=6000,  # Increased to accommodate 10 articles
         temperature=0.7,
+        logit_bias=banned_char_logit_bias("gpt-4o"),
         messages=[
             {
                 "role": "system",
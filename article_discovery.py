@@ -103,7 +103,7 @@ AI_NEWS_SOURCES = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveredArticle:
     """Article discovered from RSS feed."""
     title: str
@@ -8,7 +8,7 @@ from typing import Optional, Dict
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     """Data class for article information."""
     title: str
@@ -40,6 +40,10 @@ Examples:
 
   # Article-based (manual URLs)
   python linkedin_curator.py --type article --source manual --urls "url1,url2"
+
+Environment:
+  LLM_CACHE=1       Reuse personal story responses for identical inputs (24h)
+  LLM_CACHE_PATH    Location of the cache file
         """
     )
 
@@ -123,7 +123,6 @@ def generate_approval_pack(articles: list[Article]) -> str:
         summary_points = generate_summary_points(article)
 
         pack_lines.append(f"ARTICLE {i}: {article.title}")
-        pack_lines.append(f"Article Title: {article.title}")
         pack_lines.append(f"Article URL: {article.url}")
         pack_lines.append("")
         pack_lines.append("ARTICLE SUMMARY:")
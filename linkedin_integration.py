@@ -189,6 +189,8 @@ def post_approved_from_notion(database_id: str, poll_interval: int = 60) -> None
             "Run: pip install notion-client"
         )
 
+    from notion_helper import search_pages
+
     notion_api_key = os.getenv("NOTION_API_KEY")
     if not notion_api_key:
         raise ValueError(
@@ -205,16 +207,15 @@ def post_approved_from_notion(database_id: str, poll_interval: int = 60) -> None
 
     try:
         while True:
-            # Search for pages in the database
+            # Search for pages in the database (all result pages, no databases)
             try:
-                response = notion.search()
+                all_pages = list(search_pages(notion))
             except Exception as e:
                 print(f"[Auto-Poster] Failed to search pages: {e}")
                 time.sleep(poll_interval)
                 continue
 
             # Filter pages from our database (handle both hyphenated and non-hyphenated IDs)
-            all_pages = response.get("results", [])
             db_id_clean = database_id.replace('-', '')
 
             pages = [p for p in all_pages
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+LLM Clients - Shared, lazily created Anthropic and OpenAI API clients.
+
+Constructing a client per call opens a fresh connection pool each time, so
+every request pays a new TCP + TLS handshake. The generators fetch their
+client from here instead, which keeps connections alive between calls.
+"""
+
+import os
+import threading
+from functools import lru_cache
+from typing import Optional
+
+from text_sanitizer import REPLACEMENTS
+
+# Keep idle connections around long enough to span back-to-back generations
+KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY = 60  # seconds
+
+_ANTHROPIC = None
+_OPENAI = None
+_lock = threading.Lock()
+
+
+def get_anthropic():
+    """
+    Get the shared Anthropic client, creating it on first use.
+
+    Returns:
+        anthropic.Anthropic client
+
+    Raises:
+        ImportError: If the anthropic package is not installed
+        ValueError: If ANTHROPIC_API_KEY is not set
+    """
+    global _ANTHROPIC
+
+    if _ANTHROPIC is not None:
+        return _ANTHROPIC
+
+    try:
+        import anthropic
+        import httpx
+    except ImportError:
+        raise ImportError("anthropic package not installed. Run: pip install anthropic")
+
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+
+    with _lock:
+        if _ANTHROPIC is None:
+            _ANTHROPIC = anthropic.Anthropic(
+                api_key=api_key,
+                http_client=anthropic.DefaultHttpxClient(
+                    limits=httpx.Limits(
+                        max_keepalive_connections=KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=KEEPALIVE_EXPIRY
+                    )
+                )
+            )
+
+    return _ANTHROPIC
+
+
+def get_openai():
+    """
+    Get the shared OpenAI client, creating it on first use.
+
+    Returns:
+        openai.OpenAI client
+
+    Raises:
+        ImportError: If the openai package is not installed
+        ValueError: If OPENAI_API_KEY is not set
+    """
+    global _OPENAI
+
+    if _OPENAI is not None:
+        return _OPENAI
+
+    try:
+        import openai
+        import httpx
+    except ImportError:
+        raise ImportError("openai package not installed. Run: pip install openai")
+
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY environment variable not set")
+
+    with _lock:
+        if _OPENAI is None:
+            _OPENAI = openai.OpenAI(
+                api_key=api_key,
+                http_client=openai.DefaultHttpxClient(
+                    limits=httpx.Limits(
+                        max_keepalive_connections=KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=KEEPALIVE_EXPIRY
+                    )
+                )
+            )
+
+    return _OPENAI
+
+
+def create_async_anthropic():
+    """
+    Create a new AsyncAnthropic client for a batch of concurrent requests.
+
+    Async clients are tied to the event loop they first run on, so unlike
+    get_anthropic() this is not cached; share one client per asyncio.run().
+
+    Returns:
+        anthropic.AsyncAnthropic client
+
+    Raises:
+        ImportError: If the anthropic package is not installed
+        ValueError: If ANTHROPIC_API_KEY is not set
+    """
+    try:
+        import anthropic
+    except ImportError:
+        raise ImportError("anthropic package not installed. Run: pip install anthropic")
+
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+
+    return anthropic.AsyncAnthropic(api_key=api_key)
+
+
+@lru_cache(maxsize=32)
+def cached_system(prompt: str) -> list[dict]:
+    """
+    Build the Claude system parameter for a static prompt, marked for caching.
+
+    The block is built once per prompt and reused on every call. Treat the
+    returned list as read-only.
+
+    Args:
+        prompt: Static system prompt text
+
+    Returns:
+        One-element list holding the text block with cache_control set
+    """
+    return [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}]
+
+
+@lru_cache(maxsize=8)
+def banned_char_logit_bias(model: str) -> Optional[dict[str, int]]:
+    """
+    Build an OpenAI logit_bias that keeps the model from emitting the
+    characters sanitize_for_linkedin() would have to replace.
+
+    Only characters that encode to a single token can be banned this way;
+    the sanitizer still runs afterwards as a safety net. Requires the
+    optional tiktoken package.
+
+    Args:
+        model: OpenAI model name the bias is for
+
+    Returns:
+        Token ID to bias mapping, or None if tiktoken is not installed or
+        does not know the model
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except KeyError:
+        return None
+
+    bias = {}
+    for char in REPLACEMENTS:
+        tokens = encoding.encode(char)
+        if len(tokens) == 1:
+            bias[str(tokens[0])] = -100
+    return bias or None
+
+
+def log_cache_usage(response) -> None:
+    """Print prompt cache hit/miss token counts from a Claude response."""
+    usage = response.usage
+    print(f"[AI] Prompt cache: {getattr(usage, 'cache_read_input_tokens', 0) or 0} tokens read, "
+          f"{getattr(usage, 'cache_creation_input_tokens', 0) or 0} tokens written")
@@ -10,9 +10,49 @@ Supports 4 content types:
 """
 
 import os
+import re
 from typing import Optional
 from datetime import datetime
 
+from llm_clients import get_anthropic, banned_char_logit_bias, cached_system, log_cache_usage
+from prompts import (
+    BASE_LINKEDIN_RULES,
+    COLLEAGUE_INSIGHT_PROMPT, TECH_PERSPECTIVE_PROMPT, COMMUNITY_INSIGHT_PROMPT,
+    COLLEAGUE_INSIGHT_RULES, TECH_PERSPECTIVE_RULES, COMMUNITY_INSIGHT_RULES,
+    PERSONAL_STORY_RULES, STORY_LENGTH_GUIDANCE
+)
+from personal_story_generator import format_personal_story_pack
+
+# Section order and markers for generate_all_modes_batch()
+_BATCH_MODES = ("colleague", "tech", "community", "personal")
+_BATCH_MARKERS = {
+    mode: f"=== MODE {i} {mode.upper()} ==="
+    for i, mode in enumerate(_BATCH_MODES, 1)
+}
+_BATCH_MARKER_RE = re.compile(r"^=== MODE \d (COLLEAGUE|TECH|COMMUNITY|PERSONAL) ===[ \t]*$", re.MULTILINE)
+
+# Shared rules once, then each mode's own rules, in one cacheable system prompt
+_BATCH_SYSTEM_PROMPT = "\n\n".join(
+    [
+        BASE_LINKEDIN_RULES,
+        "You write several LinkedIn posts in one response, one per section the "
+        "user asks for. Each section below gives the rules for one content type.\n\n"
+        "OUTPUT FORMAT:\n"
+        "For every section in the user message, write the section marker line "
+        "exactly as given, then the post for that section. Do not add any other "
+        "text before, between, or after the sections."
+    ]
+    + [
+        f"{_BATCH_MARKERS[mode]}\n{prompt}"
+        for mode, prompt in zip(_BATCH_MODES, (
+            COLLEAGUE_INSIGHT_RULES,
+            TECH_PERSPECTIVE_RULES,
+            COMMUNITY_INSIGHT_RULES,
+            PERSONAL_STORY_RULES
+        ))
+    ]
+)
+
 
 def generate_colleague_insight_with_claude(
     colleague_name: str,
@@ -43,8 +83,6 @@ def generate_colleague_insight_with_claude(
 
     client = anthropic.Anthropic(api_key=api_key)
 
-    from prompts import COLLEAGUE_INSIGHT_PROMPT
-
     user_message = f"""Write a LinkedIn post about an insight I learned from my colleague.
 
 COLLEAGUE: {colleague_name}
@@ -69,10 +107,12 @@ Write an authentic, first-person post that:
         model="claude-3-5-sonnet-20241022",
         max_tokens=2000,
         temperature=0.8,
-        system=COLLEAGUE_INSIGHT_PROMPT,
+        system=cached_system(COLLEAGUE_INSIGHT_PROMPT),
         messages=[{"role": "user", "content": user_message}]
     )
 
+    log_cache_usage(response)
+
     post = response.content[0].text.strip()
 
     # Format as approval pack
@@ -100,8 +140,6 @@ def generate_colleague_insight_with_openai(
 
     client = openai.OpenAI(api_key=api_key)
 
-    from prompts import COLLEAGUE_INSIGHT_PROMPT
-
     user_message = f"""Write a LinkedIn post about an insight I learned from my colleague.
 
 COLLEAGUE: {colleague_name}
@@ -124,6 +162,7 @@ Write an authentic, first-person post that:
         model="gpt-4o",
         max_tokens=2000,
         temperature=0.8,
+        logit_bias=banned_char_logit_bias("gpt-4o"),
         messages=[
             {"role": "system", "content": COLLEAGUE_INSIGHT_PROMPT},
             {"role": "user", "content": user_message}
@@ -166,8 +205,6 @@ def generate_tech_perspective_with_claude(
 
     client = anthropic.Anthropic(api_key=api_key)
 
-    from prompts import TECH_PERSPECTIVE_PROMPT
-
     user_message = f"""Write a LinkedIn technical perspective post.
 
 TECHNOLOGY: {technology}
@@ -193,10 +230,12 @@ Write an authentic, technical post that:
         model="claude-3-5-sonnet-20241022",
         max_tokens=3000,
         temperature=0.8,
-        system=TECH_PERSPECTIVE_PROMPT,
+        system=cached_system(TECH_PERSPECTIVE_PROMPT),
         messages=[{"role": "user", "content": user_message}]
     )
 
+    log_cache_usage(response)
+
     post = response.content[0].text.strip()
     formatted = format_tech_perspective_pack(post, technology, perspective_focus)
 
@@ -222,8 +261,6 @@ def generate_tech_perspective_with_openai(
 
     client = openai.OpenAI(api_key=api_key)
 
-    from prompts import TECH_PERSPECTIVE_PROMPT
-
     user_message = f"""Write a LinkedIn technical perspective post.
 
 TECHNOLOGY: {technology}
@@ -246,6 +283,7 @@ Write an authentic, technical post that:
         model="gpt-4o",
         max_tokens=3000,
         temperature=0.8,
+        logit_bias=banned_char_logit_bias("gpt-4o"),
         messages=[
             {"role": "system", "content": TECH_PERSPECTIVE_PROMPT},
             {"role": "user", "content": user_message}
@@ -288,8 +326,6 @@ def generate_community_insight_with_claude(
 
     client = anthropic.Anthropic(api_key=api_key)
 
-    from prompts import COMMUNITY_INSIGHT_PROMPT
-
     user_message = f"""Write a LinkedIn post about a community insight.
 
 EVENT: {event}
@@ -314,10 +350,12 @@ Write an authentic post that:
         model="claude-3-5-sonnet-20241022",
         max_tokens=2000,
         temperature=0.8,
-        system=COMMUNITY_INSIGHT_PROMPT,
+        system=cached_system(COMMUNITY_INSIGHT_PROMPT),
         messages=[{"role": "user", "content": user_message}]
     )
 
+    log_cache_usage(response)
+
     post = response.content[0].text.strip()
     formatted = format_community_insight_pack(post, event, topic)
 
@@ -343,8 +381,6 @@ def generate_community_insight_with_openai(
 
     client = openai.OpenAI(api_key=api_key)
 
-    from prompts import COMMUNITY_INSIGHT_PROMPT
-
     user_message = f"""Write a LinkedIn post about a community insight.
 
 EVENT: {event}
@@ -367,6 +403,7 @@ Write an authentic post that:
         model="gpt-4o",
         max_tokens=2000,
         temperature=0.8,
+        logit_bias=banned_char_logit_bias("gpt-4o"),
         messages=[
             {"role": "system", "content": COMMUNITY_INSIGHT_PROMPT},
             {"role": "user", "content": user_message}
@@ -380,6 +417,119 @@ Write an authentic post that:
     return formatted
 
 
+def split_batch_response(text: str) -> dict[str, str]:
+    """
+    Split a batched response into one post per mode.
+
+    Args:
+        text: Model output with "=== MODE N NAME ===" marker lines
+
+    Returns:
+        Mode name to post text, for every marker found. A dropped or
+        reworded marker leaves its mode out of the result.
+    """
+    # re.split with one group yields [preamble, MODE, post, MODE, post, ...]
+    parts = _BATCH_MARKER_RE.split(text)
+    return {
+        mode.lower(): post.strip()
+        for mode, post in zip(parts[1::2], parts[2::2])
+    }
+
+
+def generate_all_modes_batch(inputs: dict[str, dict]) -> dict[str, str]:
+    """
+    Generate posts for several content modes in a single Claude API call.
+
+    One request shares the connection, the cached system prompt, and the
+    time-to-first-token across every mode instead of paying for each.
+
+    Args:
+        inputs: Mode name to keyword arguments, using the same names as the
+                single-mode generators. Any subset of:
+                "colleague": colleague_name, topic, what_you_learned, your_experience
+                "tech": technology, experience_level, perspective_focus, specific_insights
+                "community": event, topic, what_you_heard, your_context
+                "personal": topic, story_type, length
+
+    Returns:
+        Mode name to formatted approval pack, for every mode found in the response
+
+    Raises:
+        ValueError: If inputs contains an unknown mode
+    """
+    unknown = set(inputs) - set(_BATCH_MODES)
+    if unknown:
+        raise ValueError(f"Unknown mode(s): {', '.join(sorted(unknown))}")
+
+    client = get_anthropic()
+
+    sections = []
+    for mode in _BATCH_MODES:
+        if mode not in inputs:
+            continue
+        args = inputs[mode]
+        if mode == "colleague":
+            body = f"""COLLEAGUE: {args["colleague_name"]}
+TOPIC: {args["topic"]}
+WHAT I LEARNED: {args["what_you_learned"]}
+MY EXPERIENCE: {args.get("your_experience") or "Not specified"}"""
+        elif mode == "tech":
+            body = f"""TECHNOLOGY: {args["technology"]}
+MY EXPERIENCE: {args["experience_level"]}
+PERSPECTIVE: {args["perspective_focus"]}
+SPECIFIC INSIGHTS: {args.get("specific_insights") or "Not specified"}"""
+        elif mode == "community":
+            body = f"""EVENT: {args["event"]}
+TOPIC: {args["topic"]}
+WHAT I HEARD: {args["what_you_heard"]}
+MY CONTEXT: {args.get("your_context") or "Not specified"}"""
+        else:
+            length = args.get("length", "medium")
+            body = f"""STORY TYPE: {args.get("story_type", "professional_learning")}
+LENGTH: {STORY_LENGTH_GUIDANCE.get(length, "6-10 lines")}
+TOPIC: {args["topic"]}"""
+        sections.append(f"{_BATCH_MARKERS[mode]}\n{body}")
+
+    user_message = "Write one LinkedIn post for each section below.\n\n" + "\n\n".join(sections)
+
+    print(f"\n[AI] Generating {len(sections)} posts in one Claude API call...")
+
+    response = client.messages.create(
+        model="claude-3-5-sonnet-20241022",
+        max_tokens=8000,
+        temperature=0.8,
+        system=cached_system(_BATCH_SYSTEM_PROMPT),
+        messages=[{"role": "user", "content": user_message}]
+    )
+
+    log_cache_usage(response)
+
+    posts = split_batch_response(response.content[0].text)
+
+    results = {}
+    for mode, post in posts.items():
+        if mode not in inputs:
+            continue
+        args = inputs[mode]
+        if mode == "colleague":
+            results[mode] = format_colleague_insight_pack(post, args["colleague_name"], args["topic"])
+        elif mode == "tech":
+            results[mode] = format_tech_perspective_pack(post, args["technology"], args["perspective_focus"])
+        elif mode == "community":
+            results[mode] = format_community_insight_pack(post, args["event"], args["topic"])
+        else:
+            results[mode] = format_personal_story_pack(
+                post, args["topic"], args.get("story_type", "professional_learning")
+            )
+
+    missing = set(inputs) - set(results)
+    if missing:
+        print(f"[!] Response had no section for: {', '.join(sorted(missing))}")
+
+    print(f"[AI] Generated {len(results)} posts successfully.")
+    return results
+
+
 # Template-based fallbacks
 
 def generate_template_colleague_insight(
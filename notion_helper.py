@@ -7,8 +7,9 @@ different property names and schemas, avoiding hardcoded property names.
 """
 
 import os
-from typing import Optional, Dict, Any
-from notion_client import Client
+import time
+from typing import Optional, Dict, Any, Iterator
+from notion_client import Client, APIResponseError
 from functools import lru_cache
 
 
@@ -254,6 +255,89 @@ class NotionDatabaseHelper:
         self._property_cache.clear()
 
 
+def with_retry(request, max_retries: int = 3, **kwargs) -> Any:
+    """
+    Call a Notion API method, retrying with exponential backoff on rate limits.
+
+    A 429 response waits for the Retry-After header when Notion sends one,
+    otherwise 1s, doubling on each further attempt.
+
+    Args:
+        request: Bound notion_client endpoint method (e.g. notion.pages.update)
+        max_retries: Maximum number of attempts
+        **kwargs: Arguments passed to the request
+
+    Returns:
+        The API response
+    """
+    retry_delay = 1  # seconds
+
+    for attempt in range(max_retries):
+        try:
+            return request(**kwargs)
+        except APIResponseError as e:
+            if e.status == 429 or getattr(e, "code", "") == "rate_limited":
+                if attempt < max_retries - 1:
+                    headers = getattr(e, "headers", None) or {}
+                    try:
+                        wait = float(headers.get("Retry-After", retry_delay))
+                    except ValueError:
+                        wait = retry_delay
+                    print(f"[Notion] Rate limited, retrying in {wait}s...")
+                    time.sleep(wait)
+                    retry_delay *= 2  # Exponential backoff
+                    continue
+            raise  # Re-raise if not rate limit or out of retries
+
+
+def query_database(notion: Client, database_id: str, **query) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every page matching a database query, following pagination.
+
+    Args:
+        notion: Notion client
+        database_id: Database to query
+        **query: Extra query body fields (filter, sorts, ...)
+
+    Yields:
+        Page objects, 100 per request
+    """
+    cursor = None
+    while True:
+        if cursor:
+            query["start_cursor"] = cursor
+        response = with_retry(notion.databases.query, database_id=database_id, **query)
+        yield from response.get("results", [])
+        if not response.get("has_more"):
+            return
+        cursor = response.get("next_cursor")
+
+
+def search_pages(notion: Client, **query) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every page visible to the integration, following pagination.
+
+    Databases are filtered out by Notion rather than returned and skipped.
+
+    Args:
+        notion: Notion client
+        **query: Extra search body fields (query, sort, ...)
+
+    Yields:
+        Page objects, 100 per request
+    """
+    query["filter"] = {"property": "object", "value": "page"}
+    cursor = None
+    while True:
+        if cursor:
+            query["start_cursor"] = cursor
+        response = with_retry(notion.search, **query)
+        yield from response.get("results", [])
+        if not response.get("has_more"):
+            return
+        cursor = response.get("next_cursor")
+
+
 # Convenience functions for backward compatibility
 def get_notion_helper(api_key: str = None, database_id: str = None) -> NotionDatabaseHelper:
     """Get a NotionDatabaseHelper instance."""
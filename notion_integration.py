@@ -305,6 +305,46 @@ def create_notion_pages_for_articles(approval_pack: str, database_id: Optional[s
     return page_urls
 
 
+def _text_block(block_type: str, content: str, **extra) -> dict:
+    """Build a single Notion block holding one plain rich_text run."""
+    return {
+        "object": "block",
+        "type": block_type,
+        block_type: {
+            "rich_text": [{"type": "text", "text": {"content": content}}],
+            **extra
+        }
+    }
+
+
+def _build_approval_children(approval_pack: str, use_code_block: bool = False) -> list:
+    """
+    Build the block list for a single-page approval pack.
+
+    Args:
+        approval_pack: The formatted approval pack content
+        use_code_block: Render the pack as a code block instead of a quote
+            (used when retrying page creation without the Status property)
+
+    Returns:
+        List of Notion block dicts ready for notion.pages.create()
+    """
+    if use_code_block:
+        pack_block = _text_block("code", approval_pack, language="plain text")
+    else:
+        pack_block = _text_block("quote", approval_pack)
+
+    return [
+        _text_block("heading_2", "Approval Pack"),
+        pack_block,
+        _text_block("heading_2", "Review & Approval"),
+        _text_block("to_do", "Review the approval pack above", checked=False),
+        _text_block("to_do", "Edit the LinkedIn draft if needed", checked=False),
+        _text_block("to_do", "Copy the draft and post to LinkedIn manually", checked=False),
+        _text_block("to_do", "Update status to 'Posted' after publishing", checked=False),
+    ]
+
+
 def create_notion_page(approval_pack: str, database_id: Optional[str] = None) -> str:
     """
     Create a new page in Notion with the approval pack content.
@@ -386,111 +426,8 @@ def create_notion_page(approval_pack: str, database_id: Optional[str] = None) ->
                 "database_id": db_id
             },
             properties=properties,
-        children=[
-            {
-                "object": "block",
-                "type": "heading_2",
-                "heading_2": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": "Approval Pack"
-                            }
-                        }
-                    ]
-                }
-            },
-            {
-                "object": "block",
-                "type": "quote",
-                "quote": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": approval_pack
-                            }
-                        }
-                    ]
-                }
-            },
-            {
-                "object": "block",
-                "type": "heading_2",
-                "heading_2": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": "Review & Approval"
-                            }
-                        }
-                    ]
-                }
-            },
-            {
-                "object": "block",
-                "type": "to_do",
-                "to_do": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": "Review the approval pack above"
-                            }
-                        }
-                    ],
-                    "checked": False
-                }
-            },
-            {
-                "object": "block",
-                "type": "to_do",
-                "to_do": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": "Edit the LinkedIn draft if needed"
-                            }
-                        }
-                    ],
-                    "checked": False
-                }
-            },
-            {
-                "object": "block",
-                "type": "to_do",
-                "to_do": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": "Copy the draft and post to LinkedIn manually"
-                            }
-                        }
-                    ],
-                    "checked": False
-                }
-            },
-            {
-                "object": "block",
-                "type": "to_do",
-                "to_do": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": "Update status to 'Posted' after publishing"
-                            }
-                        }
-                    ],
-                    "checked": False
-                }
-            }
-        ]
-    )
+            children=_build_approval_children(approval_pack)
+        )
 
         page_id = response["id"]
         page_url = f"https://notion.so/{page_id.replace('-', '')}"
@@ -519,111 +456,7 @@ def create_notion_page(approval_pack: str, database_id: Optional[str] = None) ->
                         ]
                     }
                 },
-                children=[
-                    {
-                        "object": "block",
-                        "type": "heading_2",
-                        "heading_2": {
-                            "rich_text": [
-                                {
-                                    "type": "text",
-                                    "text": {
-                                        "content": "Approval Pack"
-                                    }
-                                }
-                            ]
-                        }
-                    },
-                    {
-                        "object": "block",
-                        "type": "code",
-                        "code": {
-                            "rich_text": [
-                                {
-                                    "type": "text",
-                                    "text": {
-                                        "content": approval_pack
-                                    }
-                                }
-                            ],
-                            "language": "plain text"
-                        }
-                    },
-                    {
-                        "object": "block",
-                        "type": "heading_2",
-                        "heading_2": {
-                            "rich_text": [
-                                {
-                                    "type": "text",
-                                    "text": {
-                                        "content": "Review & Approval"
-                                    }
-                                }
-                            ]
-                        }
-                    },
-                    {
-                        "object": "block",
-                        "type": "to_do",
-                        "to_do": {
-                            "rich_text": [
-                                {
-                                    "type": "text",
-                                    "text": {
-                                        "content": "Review the approval pack above"
-                                    }
-                                }
-                            ],
-                            "checked": False
-                        }
-                    },
-                    {
-                        "object": "block",
-                        "type": "to_do",
-                        "to_do": {
-                            "rich_text": [
-                                {
-                                    "type": "text",
-                                    "text": {
-                                        "content": "Edit the LinkedIn draft if needed"
-                                    }
-                                }
-                            ],
-                            "checked": False
-                        }
-                    },
-                    {
-                        "object": "block",
-                        "type": "to_do",
-                        "to_do": {
-                            "rich_text": [
-                                {
-                                    "type": "text",
-                                    "text": {
-                                        "content": "Copy the draft and post to LinkedIn manually"
-                                    }
-                                }
-                            ],
-                            "checked": False
-                        }
-                    },
-                    {
-                        "object": "block",
-                        "type": "to_do",
-                        "to_do": {
-                            "rich_text": [
-                                {
-                                    "type": "text",
-                                    "text": {
-                                        "content": "Update status to 'Posted' after publishing"
-                                    }
-                                }
-                            ],
-                            "checked": False
-                        }
-                    }
-                ]
+                children=_build_approval_children(approval_pack, use_code_block=True)
             )
 
             page_id = response["id"]
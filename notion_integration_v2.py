@@ -11,9 +11,75 @@ Fixed:
 """
 
 import os
+import re
+from datetime import datetime
 from notion_client import Client
 from text_sanitizer import sanitize_for_linkedin
-from notion_helper import NotionDatabaseHelper
+from notion_helper import NotionDatabaseHelper, with_retry
+
+
+# Post body: everything after the "LINKEDIN POST:" line up to the
+# instructions section or the "=====" separator that precedes it
+_POST_RE = re.compile(
+    r"LINKEDIN POST:[^\n]*\n(.*?)(?=^(?:APPROVAL INSTRUCTIONS|EDITING INSTRUCTIONS|INSTRUCTIONS|={5,})|\Z)",
+    re.DOTALL | re.IGNORECASE | re.MULTILINE
+)
+
+# Static blocks shared by every page; only the post paragraphs vary
+_HEADER_BLOCKS = (
+    {
+        "object": "block",
+        "type": "heading_2",
+        "heading_2": {
+            "rich_text": [{"type": "text", "text": {"content": "LinkedIn Post"}}]
+        }
+    },
+    {"object": "block", "type": "divider", "divider": {}}
+)
+
+_APPROVAL_BLOCKS = (
+    {"object": "block", "type": "divider", "divider": {}},
+    {
+        "object": "block",
+        "type": "heading_2",
+        "heading_2": {
+            "rich_text": [{"type": "text", "text": {"content": "Review & Approval"}}]
+        }
+    },
+    {
+        "object": "block",
+        "type": "to_do",
+        "to_do": {
+            "rich_text": [{"type": "text", "text": {"content": "Review the post content"}}],
+            "checked": False
+        }
+    },
+    {
+        "object": "block",
+        "type": "to_do",
+        "to_do": {
+            "rich_text": [{"type": "text", "text": {"content": "Edit if needed"}}],
+            "checked": False
+        }
+    },
+    {
+        "object": "block",
+        "type": "to_do",
+        "to_do": {
+            "rich_text": [{"type": "text", "text": {"content": "Change status to Approved when ready"}}],
+            "checked": False
+        }
+    }
+)
+
+
+def _paragraph_block(text):
+    """Build a paragraph block; only the text differs between paragraphs."""
+    return {
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {"rich_text": [{"type": "text", "text": {"content": text}}]}
+    }
 
 
 def create_notion_page_improved(approval_pack, title=None, post_type="Article"):
@@ -31,109 +97,33 @@ def create_notion_page_improved(approval_pack, title=None, post_type="Article"):
 
     notion_helper = NotionDatabaseHelper()
 
-    from datetime import datetime
     date_str = datetime.now().strftime("%Y-%m-%d")
     page_title = title or f"LinkedIn Post - {date_str}"
 
     print(f"\n[Notion] Creating page with improved formatting...")
 
     # Parse content and build blocks
-    children = [
-        {
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [{"type": "text", "text": {"content": "LinkedIn Post"}}]
-            }
-        },
-        {"object": "block", "type": "divider", "divider": {}}
-    ]
+    children = list(_HEADER_BLOCKS)
 
     # Extract and sanitize post content
-    lines = approval_pack.split('\n')
-    in_post = False
-    post_content = []
-
-    for line in lines:
-        if "LINKEDIN POST:" in line.upper():
-            in_post = True
-            continue
-        if "APPROVAL" in line.upper() or "INSTRUCTIONS" in line.upper():
-            break
-        if in_post and line.strip():
-            # Sanitize each line to avoid encoding issues
-            sanitized_line = sanitize_for_linkedin(line.strip())
-            post_content.append(sanitized_line)
-
-    # Combine into paragraphs (double newline = new paragraph)
-    current_para = []
-    for line in post_content:
-        if not line:  # Empty line = paragraph break
-            if current_para:
-                para_text = ' '.join(current_para)
-                # Validate length before adding
-                if len(para_text) > 3000:
-                    para_text = para_text[:2997] + "..."
-                    print(f"[Notion] Warning: Content truncated to 3000 chars")
-                children.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [{"type": "text", "text": {"content": para_text}}]
-                    }
-                })
-                current_para = []
-        else:
-            current_para.append(line)
-
-    # Add remaining paragraph
-    if current_para:
-        para_text = ' '.join(current_para)
+    match = _POST_RE.search(approval_pack)
+    post_content = [
+        sanitize_for_linkedin(line.strip())
+        for line in match.group(1).splitlines()
+        if line.strip()
+    ] if match else []
+
+    # Post lines are combined into a single paragraph block
+    if post_content:
+        para_text = ' '.join(post_content)
+        # Validate length before adding
         if len(para_text) > 3000:
             para_text = para_text[:2997] + "..."
-        children.append({
-            "object": "block",
-            "type": "paragraph",
-            "paragraph": {
-                "rich_text": [{"type": "text", "text": {"content": para_text}}]
-            }
-        })
+            print(f"[Notion] Warning: Content truncated to 3000 chars")
+        children.append(_paragraph_block(para_text))
 
     # Add approval section
-    children.extend([
-        {"object": "block", "type": "divider", "divider": {}},
-        {
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [{"type": "text", "text": {"content": "Review & Approval"}}]
-            }
-        },
-        {
-            "object": "block",
-            "type": "to_do",
-            "to_do": {
-                "rich_text": [{"type": "text", "text": {"content": "Review the post content"}}],
-                "checked": False
-            }
-        },
-        {
-            "object": "block",
-            "type": "to_do",
-            "to_do": {
-                "rich_text": [{"type": "text", "text": {"content": "Edit if needed"}}],
-                "checked": False
-            }
-        },
-        {
-            "object": "block",
-            "type": "to_do",
-            "to_do": {
-                "rich_text": [{"type": "text", "text": {"content": "Change status to Approved when ready"}}],
-                "checked": False
-            }
-        }
-    ])
+    children.extend(_APPROVAL_BLOCKS)
 
     # Build properties dynamically using helper
     properties = notion_helper.build_page_properties(
@@ -143,27 +133,12 @@ def create_notion_page_improved(approval_pack, title=None, post_type="Article"):
     )
 
     # Create page with retry for rate limits
-    max_retries = 3
-    retry_delay = 1  # seconds
-
-    for attempt in range(max_retries):
-        try:
-            response = notion_helper.notion.pages.create(
-                parent={"database_id": notion_helper.database_id},
-                properties=properties,
-                children=children
-            )
-            break
-        except Exception as e:
-            error_str = str(e).lower()
-            if 'rate limit' in error_str or '429' in error_str:
-                if attempt < max_retries - 1:
-                    print(f"[Notion] Rate limited, retrying in {retry_delay}s...")
-                    import time
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                    continue
-            raise  # Re-raise if not rate limit or out of retries
+    response = with_retry(
+        notion_helper.notion.pages.create,
+        parent={"database_id": notion_helper.database_id},
+        properties=properties,
+        children=children
+    )
 
     page_url = f"https://notion.so/{response['id'].replace('-', '')}"
     print(f"[Notion] Page created: {page_url}")
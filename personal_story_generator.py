@@ -2,11 +2,57 @@
 """
 Personal Story Generator - Generates pure personal experience posts
 without requiring articles. Uses AI to craft authentic-sounding stories.
+
+Set LLM_CACHE=1 to reuse the story for identical inputs (see response_cache).
 """
 
+import hashlib
 import os
 from typing import Optional
 from datetime import datetime
+from functools import lru_cache
+
+from llm_clients import get_anthropic, get_openai, banned_char_logit_bias, cached_system, log_cache_usage
+from prompts import PERSONAL_STORY_PROMPT, STORY_LENGTH_GUIDANCE
+from response_cache import make_cache_key, get_cached, store_cached
+
+_SEP = "=" * 70
+
+# Story models; also part of the response cache key
+STORY_MODEL = "claude-3-5-sonnet-20241022"
+STORY_OPENAI_MODEL = "gpt-4o"
+
+# Long stories run ~15 lines (~400 tokens); 3x headroom without over-reserving
+STORY_MAX_TOKENS = 1200
+
+# Per-request story settings, sent after the static rules
+_STORY_CONTEXT_TEMPLATE = """STORY TYPE: {story_type}
+LENGTH: {length_desc}
+
+Write authentically about: {topic}
+"""
+
+_STORY_USER_TEMPLATE = """Write a personal LinkedIn post about: {topic}
+
+Make it sound authentic and specific. Include:
+- Concrete details (not vague generalizations)
+- Personal thoughts or feelings
+- A clear insight or takeaway
+- Professional but conversational tone
+
+Write {length} length post."""
+
+
+@lru_cache(maxsize=64)
+def _build_story_prompts(topic: str, story_type: str, length: str) -> tuple[str, str]:
+    """Format the per-request story context and user message."""
+    story_prompt = _STORY_CONTEXT_TEMPLATE.format(
+        story_type=story_type,
+        length_desc=STORY_LENGTH_GUIDANCE.get(length, "6-10 lines"),
+        topic=topic
+    )
+    user_message = _STORY_USER_TEMPLATE.format(topic=topic, length=length)
+    return story_prompt, user_message
 
 
 def generate_personal_story_with_claude(
@@ -26,83 +72,31 @@ def generate_personal_story_with_claude(
     Returns:
         Formatted personal story post ready for LinkedIn
     """
-    try:
-        import anthropic
-    except ImportError:
-        raise ImportError("anthropic package not installed. Run: pip install anthropic")
-
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        raise ValueError("ANTHROPIC_API_KEY environment variable not set")
-
-    client = anthropic.Anthropic(api_key=api_key)
-
-    length_guidance = {
-        "short": "3-5 lines (quick insight)",
-        "medium": "6-10 lines (balanced storytelling)",
-        "long": "10-15 lines (deeper reflection)"
-    }
-
-    system_prompt = f"""You are an authentic LinkedIn professional sharing a genuine personal experience.
-
-STORY TYPE: {story_type}
-LENGTH: {length_guidance.get(length, "6-10 lines")}
-
-CRITICAL RULES:
-- Write ENTIRELY in first-person ("I", "my", "me")
-- Make it sound like a REAL personal experience (not generated)
-- Use specific details and concrete examples
-- Include emotions/thoughts/struggles (not just outcomes)
-- Avoid generic platitudes and clichés
-- No emojis
-- Professional but conversational tone
-- Length: {length_guidance.get(length, "6-10 lines")}
-
-STORY STRUCTURE:
-1. Hook: Start in the middle of the action or with a thought/feeling
-2. Context: Briefly set the scene (2-3 sentences)
-3. The Experience: What actually happened (main part)
-4. The Insight: What you learned or why it matters (1-2 sentences)
-5. Takeaway: Optional closing thought
-
-AUTHENTICITY GUIDELINES:
-- Include specific details (times, places, numbers, names of frameworks/tools)
-- Show vulnerability (admit mistakes, struggles, doubts)
-- Use natural language (contractions, occasional incomplete sentences)
-- Avoid: "revolutionary", "game-changing", "unbelievable", "amazing"
-- Prefer: "interesting", "surprising", "challenging", "worth considering"
-- CRITICAL: NO em dashes (—) - use regular commas, periods, or semicolons instead
-- Avoid: "word—word" format - use "word, word" or separate sentences instead
-- CRITICAL: Use STRAIGHT QUOTES only - use ' not ' and " not "
-- Never use curly/smart quotes - they display as junk on LinkedIn
-- Always use straight apostrophes in contractions: it's, don't, won't, I'm, we're
-
-Write authentically about: {topic}
-"""
+    cache_key = make_cache_key("personal_story", STORY_MODEL, topic, story_type, length)
+    story = get_cached(cache_key)
+    if story is not None:
+        print("[Cache] Using cached personal story")
+        return format_personal_story_pack(story, topic, story_type)
 
-    user_message = f"""Write a personal LinkedIn post about: {topic}
+    client = get_anthropic()
 
-Make it sound authentic and specific. Include:
-- Concrete details (not vague generalizations)
-- Personal thoughts or feelings
-- A clear insight or takeaway
-- Professional but conversational tone
-
-Write {length} length post."""
+    story_prompt, user_message = _build_story_prompts(topic, story_type, length)
 
     print("\n[AI] Generating personal story with Claude API...")
     print(f"[AI] Topic: {topic}")
     print(f"[AI] Type: {story_type}, Length: {length}")
 
-    response = client.messages.create(
-        model="claude-3-5-sonnet-20241022",
-        max_tokens=4000,
+    with client.messages.stream(
+        model=STORY_MODEL,
+        max_tokens=STORY_MAX_TOKENS,
         temperature=0.8,  # Higher for more creativity
-        system=system_prompt,
+        system=cached_system(PERSONAL_STORY_PROMPT) + [{"type": "text", "text": story_prompt}],
         messages=[{"role": "user", "content": user_message}]
-    )
+    ) as stream:
+        story = "".join(stream.text_stream)
+        log_cache_usage(stream.get_final_message())
 
-    story = response.content[0].text
+    store_cached(cache_key, story)
 
     # Format as approval pack
     formatted = format_personal_story_pack(story, topic, story_type)
@@ -128,85 +122,34 @@ def generate_personal_story_with_openai(
     Returns:
         Formatted personal story post ready for LinkedIn
     """
-    try:
-        import openai
-    except ImportError:
-        raise ImportError("openai package not installed. Run: pip install openai")
-
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY environment variable not set")
-
-    client = openai.OpenAI(api_key=api_key)
-
-    length_guidance = {
-        "short": "3-5 lines (quick insight)",
-        "medium": "6-10 lines (balanced storytelling)",
-        "long": "10-15 lines (deeper reflection)"
-    }
-
-    system_prompt = f"""You are an authentic LinkedIn professional sharing a genuine personal experience.
+    cache_key = make_cache_key("personal_story", STORY_OPENAI_MODEL, topic, story_type, length)
+    story = get_cached(cache_key)
+    if story is not None:
+        print("[Cache] Using cached personal story")
+        return format_personal_story_pack(story, topic, story_type)
 
-STORY TYPE: {story_type}
-LENGTH: {length_guidance.get(length, "6-10 lines")}
+    client = get_openai()
 
-CRITICAL RULES:
-- Write ENTIRELY in first-person ("I", "my", "me")
-- Make it sound like a REAL personal experience (not generated)
-- Use specific details and concrete examples
-- Include emotions/thoughts/struggles (not just outcomes)
-- Avoid generic platitudes and clichés
-- No emojis
-- Professional but conversational tone
-- Length: {length_guidance.get(length, "6-10 lines")}
-
-STORY STRUCTURE:
-1. Hook: Start in the middle of the action or with a thought/feeling
-2. Context: Briefly set the scene (2-3 sentences)
-3. The Experience: What actually happened (main part)
-4. The Insight: What you learned or why it matters (1-2 sentences)
-5. Takeaway: Optional closing thought
-
-AUTHENTICITY GUIDELINES:
-- Include specific details (times, places, numbers, names of frameworks/tools)
-- Show vulnerability (admit mistakes, struggles, doubts)
-- Use natural language (contractions, occasional incomplete sentences)
-- Avoid: "revolutionary", "game-changing", "unbelievable", "amazing"
-- Prefer: "interesting", "surprising", "challenging", "worth considering"
-- CRITICAL: NO em dashes (—) - use regular commas, periods, or semicolons instead
-- Avoid: "word—word" format - use "word, word" or separate sentences instead
-- CRITICAL: Use STRAIGHT QUOTES only - use ' not ' and " not "
-- Never use curly/smart quotes - they display as junk on LinkedIn
-- Always use straight apostrophes in contractions: it's, don't, won't, I'm, we're
-
-Write authentically about: {topic}
-"""
-
-    user_message = f"""Write a personal LinkedIn post about: {topic}
-
-Make it sound authentic and specific. Include:
-- Concrete details (not vague generalizations)
-- Personal thoughts or feelings
-- A clear insight or takeaway
-- Professional but conversational tone
-
-Write {length} length post."""
+    story_prompt, user_message = _build_story_prompts(topic, story_type, length)
 
     print("\n[AI] Generating personal story with OpenAI API...")
     print(f"[AI] Topic: {topic}")
     print(f"[AI] Type: {story_type}, Length: {length}")
 
-    response = client.chat.completions.create(
-        model="gpt-4o",
-        max_tokens=4000,
+    stream = client.chat.completions.create(
+        model=STORY_OPENAI_MODEL,
+        max_tokens=STORY_MAX_TOKENS,
         temperature=0.8,  # Higher for more creativity
+        logit_bias=banned_char_logit_bias(STORY_OPENAI_MODEL),
         messages=[
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": PERSONAL_STORY_PROMPT + "\n" + story_prompt},
             {"role": "user", "content": user_message}
-        ]
+        ],
+        stream=True
     )
 
-    story = response.choices[0].message.content
+    story = "".join(chunk.choices[0].delta.content or "" for chunk in stream if chunk.choices)
+    store_cached(cache_key, story)
 
     # Format as approval pack
     formatted = format_personal_story_pack(story, topic, story_type)
@@ -235,7 +178,7 @@ def format_personal_story_pack(
         "",
         story,
         "",
-        "=" * 70,
+        _SEP,
         "",
         "APPROVAL INSTRUCTIONS:",
         "1. Review the story above",
@@ -288,8 +231,8 @@ def generate_template_personal_story(
     template_list = templates.get(story_type, templates["professional_learning"])
 
     # Select template based on topic hash for consistency
-    import hashlib
-    template_index = int(hashlib.md5(topic.encode()).hexdigest(), 16) % len(template_list)
+    topic_hash = hashlib.blake2s(topic.encode("utf-8"), digest_size=4).digest()
+    template_index = int.from_bytes(topic_hash, "little") % len(template_list)
     template = template_list[template_index]
 
     # Build the post
@@ -315,7 +258,7 @@ def generate_template_personal_story(
         "",
         post,
         "",
-        "=" * 70,
+        _SEP,
         "",
         "EDITING INSTRUCTIONS:",
         "1. Replace bracketed text with your specific details",
@@ -3,35 +3,29 @@
 Polish Generator - Enhance user-provided content while maintaining voice.
 
 Provides intelligent polishing of draft content without losing the author's authentic voice.
+
+Set LLM_CACHE=1 to reuse the polish result for identical drafts (see response_cache).
 """
 
+import asyncio
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
 from typing import Optional
 
+from llm_clients import get_anthropic, get_openai, create_async_anthropic, banned_char_logit_bias, cached_system, log_cache_usage
+from response_cache import make_cache_key, get_cached, store_cached
 
-def polish_with_claude(draft_content: str, context: str = "") -> str:
-    """
-    Polish content using Claude API while maintaining user's voice.
-
-    Args:
-        draft_content: User's draft content
-        context: Additional context about the content
+_SEP = "=" * 70
 
-    Returns:
-        Polished LinkedIn post
-    """
-    try:
-        import anthropic
-    except ImportError:
-        raise ImportError("anthropic package not installed. Run: pip install anthropic")
+# Polishing is a grammar/flow pass, so a smaller, faster model is enough
+POLISH_MODEL = os.getenv("POLISH_MODEL", "claude-3-5-haiku-20241022")
+POLISH_OPENAI_MODEL = os.getenv("POLISH_OPENAI_MODEL", "gpt-4o-mini")
 
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+# Polished posts are 3-10 lines (~150 tokens)
+POLISH_MAX_TOKENS = 400
 
-    client = anthropic.Anthropic(api_key=api_key)
-
-    system_prompt = """You are an expert at polishing LinkedIn posts while maintaining the author's authentic voice.
+_POLISH_SYSTEM_PROMPT = """You are an expert at polishing LinkedIn posts while maintaining the author's authentic voice.
 
 Your job:
 1. Fix grammar and spelling
@@ -47,7 +41,7 @@ CRITICAL: The result must sound like THE SAME PERSON wrote it, just better.
 
 Output ONLY the polished post, no explanations or meta-commentary."""
 
-    user_message = f"""Polish this LinkedIn post for me:
+_POLISH_USER_TEMPLATE = """Polish this LinkedIn post for me:
 
 {draft_content}
 
@@ -63,102 +57,172 @@ Requirements:
 
 Output ONLY the polished post."""
 
-    response = client.messages.create(
-        model="claude-3-5-sonnet-20241022",
-        max_tokens=2000,
+
+def polish_with_claude(draft_content: str, context: str = "") -> str:
+    """
+    Polish content using Claude API while maintaining user's voice.
+
+    Args:
+        draft_content: User's draft content
+        context: Additional context about the content
+
+    Returns:
+        Polished LinkedIn post
+    """
+    client = get_anthropic()
+
+    user_message = _POLISH_USER_TEMPLATE.format(draft_content=draft_content, context=context)
+
+    with client.messages.stream(
+        model=POLISH_MODEL,
+        max_tokens=POLISH_MAX_TOKENS,
         temperature=0.7,  # Lower for polishing to maintain voice
-        system=system_prompt,
+        system=cached_system(_POLISH_SYSTEM_PROMPT),
         messages=[{"role": "user", "content": user_message}]
-    )
+    ) as stream:
+        polished = "".join(stream.text_stream)
+        log_cache_usage(stream.get_final_message())
 
-    return response.content[0].text.strip()
+    return polished.strip()
 
 
 def polish_with_openai(draft_content: str, context: str = "") -> str:
     """Polish content using OpenAI API."""
-    try:
-        import openai
-    except ImportError:
-        raise ImportError("openai package not installed. Run: pip install openai")
+    client = get_openai()
 
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY environment variable not set")
+    user_message = _POLISH_USER_TEMPLATE.format(draft_content=draft_content, context=context)
 
-    client = openai.OpenAI(api_key=api_key)
+    stream = client.chat.completions.create(
+        model=POLISH_OPENAI_MODEL,
+        max_tokens=POLISH_MAX_TOKENS,
+        temperature=0.7,
+        logit_bias=banned_char_logit_bias(POLISH_OPENAI_MODEL),
+        messages=[
+            {"role": "system", "content": _POLISH_SYSTEM_PROMPT},
+            {"role": "user", "content": user_message}
+        ],
+        stream=True
+    )
 
-    system_prompt = """You are an expert at polishing LinkedIn posts while maintaining the author's authentic voice.
+    polished = "".join(chunk.choices[0].delta.content or "" for chunk in stream if chunk.choices)
+    return polished.strip()
 
-Your job:
-1. Fix grammar and spelling
-2. Improve flow and readability
-3. Suggest better word choices (but don't change meaning)
-4. Adjust length for LinkedIn (3-10 lines ideally)
-5. Add a strong hook if missing
-6. Keep the author's voice and personality intact
-7. Don't add information they didn't provide
-8. Remove any filler or redundancy
 
-CRITICAL: The result must sound like THE SAME PERSON wrote it, just better.
+async def polish_with_claude_async(client, draft_content: str, context: str = "") -> str:
+    """
+    Polish content using the async Claude API.
 
-Output ONLY the polished post, no explanations or meta-commentary."""
+    Args:
+        client: anthropic.AsyncAnthropic client (see create_async_anthropic)
+        draft_content: User's draft content
+        context: Additional context about the content
 
-    user_message = f"""Polish this LinkedIn post for me:
+    Returns:
+        Polished LinkedIn post
+    """
+    user_message = _POLISH_USER_TEMPLATE.format(draft_content=draft_content, context=context)
 
-{draft_content}
+    response = await client.messages.create(
+        model=POLISH_MODEL,
+        max_tokens=POLISH_MAX_TOKENS,
+        temperature=0.7,  # Lower for polishing to maintain voice
+        system=cached_system(_POLISH_SYSTEM_PROMPT),
+        messages=[{"role": "user", "content": user_message}]
+    )
 
-{context}
+    log_cache_usage(response)
 
-Requirements:
-- Keep my voice and personality
-- Fix grammar and improve flow
-- Make it more engaging
-- Keep it to 3-10 lines
-- Don't add new information
-- Don't change my meaning
+    return response.content[0].text.strip()
 
-Output ONLY the polished post."""
 
-    response = client.chat.completions.create(
-        model="gpt-4o",
-        max_tokens=2000,
-        temperature=0.7,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_message}
-        ]
-    )
+async def polish_batch(drafts: list[str], context: str = "", max_concurrency: int = 5) -> list[str]:
+    """
+    Polish several drafts concurrently with Claude.
 
-    return response.choices[0].message.content.strip()
+    Args:
+        drafts: Draft contents to polish
+        context: Additional context applied to every draft
+        max_concurrency: Maximum requests in flight (keeps under rate limits)
 
+    Returns:
+        Polished posts, in the same order as drafts
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
 
-def format_polished_pack(original: str, polished: str) -> str:
-    """Format polished content as approval pack."""
-    from datetime import datetime
+    async with create_async_anthropic() as client:
+        async def polish_one(draft: str) -> str:
+            async with semaphore:
+                return await polish_with_claude_async(client, draft, context)
 
-    date_str = datetime.now().strftime("%Y-%m-%d")
+        return await asyncio.gather(*(polish_one(draft) for draft in drafts))
 
-    return f"""CONTENT POLISHER
-Processed: {date_str}
 
-{"=" * 70}
+def polish_batch_sync(drafts: list[str], context: str = "", max_concurrency: int = 5) -> list[str]:
+    """Synchronous wrapper around polish_batch() for non-async callers."""
+    return asyncio.run(polish_batch(drafts, context, max_concurrency))
 
-ORIGINAL DRAFT:
-{original}
 
-{"=" * 70}
+def format_polished_pack(original: str, polished: str) -> str:
+    """Format polished content as approval pack."""
+    date_str = datetime.now().strftime("%Y-%m-%d")
+
+    pack_lines = [
+        "CONTENT POLISHER",
+        f"Processed: {date_str}",
+        "",
+        _SEP,
+        "",
+        "ORIGINAL DRAFT:",
+        original,
+        "",
+        _SEP,
+        "",
+        "POLISHED VERSION:",
+        polished,
+        "",
+        _SEP,
+        "",
+        "NEXT STEPS:",
+        "1. Compare original and polished versions",
+        "2. Ensure your voice is maintained",
+        "3. Make any final edits",
+        "4. Post to LinkedIn when ready",
+        ""
+    ]
+
+    return "\n".join(pack_lines)
+
+
+def _polish_race(draft_content: str, context: str) -> Optional[tuple[str, str]]:
+    """
+    Polish with Claude and OpenAI concurrently and keep the first success.
 
-POLISHED VERSION:
-{polished}
+    Args:
+        draft_content: User's draft content
+        context: Additional context
 
-{"=" * 70}
+    Returns:
+        Tuple of (polished_content, provider_used), or None if both failed
+    """
+    executor = ThreadPoolExecutor(max_workers=2)
+    pending = {
+        executor.submit(polish_with_claude, draft_content, context): "Claude",
+        executor.submit(polish_with_openai, draft_content, context): "OpenAI",
+    }
 
-NEXT STEPS:
-1. Compare original and polished versions
-2. Ensure your voice is maintained
-3. Make any final edits
-4. Post to LinkedIn when ready
-"""
+    try:
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                provider = pending.pop(future)
+                try:
+                    return future.result(), provider
+                except Exception as e:
+                    print(f"[!] {provider} polishing failed: {e}")
+        return None
+    finally:
+        # Don't block on the slower request; its result is discarded
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 def polish_content(draft_content: str, context: str = "") -> tuple[str, str]:
@@ -172,10 +236,27 @@ def polish_content(draft_content: str, context: str = "") -> tuple[str, str]:
     Returns:
         Tuple of (polished_content, provider_used)
     """
+    # Either model may answer, so both are part of the key
+    cache_key = make_cache_key("polish", POLISH_MODEL, POLISH_OPENAI_MODEL, draft_content, context)
+    cached = get_cached(cache_key)
+    if cached is not None:
+        print("[Cache] Using cached polish result")
+        return cached[0], cached[1]
+
+    # Race both providers when explicitly enabled (doubles token spend)
+    if os.getenv("POLISH_RACE") == "1" and os.getenv("ANTHROPIC_API_KEY") and os.getenv("OPENAI_API_KEY"):
+        result = _polish_race(draft_content, context)
+        if result:
+            store_cached(cache_key, list(result))
+            return result
+        print("[!] AI polishing unavailable, returning original")
+        return draft_content, "None"
+
     # Determine provider
     if os.getenv("ANTHROPIC_API_KEY"):
         try:
             polished = polish_with_claude(draft_content, context)
+            store_cached(cache_key, [polished, "Claude"])
             return polished, "Claude"
         except Exception as e:
             print(f"[!] Claude polishing failed: {e}")
@@ -183,6 +264,7 @@ def polish_content(draft_content: str, context: str = "") -> tuple[str, str]:
     if os.getenv("OPENAI_API_KEY"):
         try:
             polished = polish_with_openai(draft_content, context)
+            store_cached(cache_key, [polished, "OpenAI"])
             return polished, "OpenAI"
         except Exception as e:
             print(f"[!] OpenAI polishing failed: {e}")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Response Cache - Local cache for LLM responses keyed on the exact inputs.
+
+Re-running a generation with the same draft/topic returns the stored
+response instead of paying for another API round-trip. Entries live in a
+small SQLite file and expire after a day by default.
+
+The cache is off by default, since the cached calls are sampled and a
+re-run should normally produce a fresh post. Set LLM_CACHE=1 to enable
+it, and LLM_CACHE_PATH to move the file.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Any, Optional
+
+# Bump when prompt text changes so stale responses are not served
+PROMPT_VERSION = "3"
+
+DEFAULT_TTL = 86400  # seconds
+
+CACHE_PATH = os.path.expanduser(
+    os.getenv("LLM_CACHE_PATH", "~/.cache/linkedin_posts/responses.sqlite3")
+)
+
+
+def is_cache_enabled() -> bool:
+    """Check whether response caching is enabled (opt-in via LLM_CACHE=1)."""
+    return os.getenv("LLM_CACHE", "0") == "1"
+
+
+def make_cache_key(*parts: str) -> str:
+    """
+    Build a cache key from the prompt version and the call inputs.
+
+    Args:
+        *parts: Strings that identify the request (function name, inputs, ...)
+
+    Returns:
+        Hex SHA-1 digest of the joined parts
+    """
+    return hashlib.sha1("|".join((PROMPT_VERSION,) + parts).encode("utf-8")).hexdigest()
+
+
+def _connect() -> sqlite3.Connection:
+    cache_dir = os.path.dirname(CACHE_PATH)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    conn = sqlite3.connect(CACHE_PATH, timeout=5)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS responses "
+        "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+    )
+    return conn
+
+
+def get_cached(key: str) -> Optional[Any]:
+    """
+    Look up a cached response.
+
+    Args:
+        key: Cache key from make_cache_key()
+
+    Returns:
+        The stored value, or None on a miss, expiry, or disabled cache
+    """
+    if not is_cache_enabled():
+        return None
+
+    try:
+        with closing(_connect()) as conn:
+            row = conn.execute(
+                "SELECT value FROM responses WHERE key = ? AND expires_at > ?",
+                (key, time.time())
+            ).fetchone()
+    except (sqlite3.Error, OSError) as e:
+        print(f"[Cache] Lookup failed: {e}")
+        return None
+
+    return json.loads(row[0]) if row else None
+
+
+def store_cached(key: str, value: Any, expire: int = DEFAULT_TTL) -> None:
+    """
+    Store a response in the cache.
+
+    Args:
+        key: Cache key from make_cache_key()
+        value: JSON-serializable value to store
+        expire: Time to live in seconds
+    """
+    if not is_cache_enabled():
+        return
+
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time() + expire)
+            )
+    except (sqlite3.Error, OSError) as e:
+        print(f"[Cache] Store failed: {e}")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+SMTP Notifier - One SMTP session shared by several outgoing emails.
+"""
+
+import smtplib
+
+# Seconds to wait on the SMTP server before giving up, so a stuck server
+# cannot hang the workflow
+SMTP_TIMEOUT = 10
+
+
+class Notifier:
+    """
+    SMTP connection that stays open while several notifications are sent.
+
+    Usage:
+        with Notifier(server, port, email, password) as notifier:
+            for msg in messages:
+                notifier.send(msg)
+    """
+
+    def __init__(self, smtp_server: str, smtp_port: int, smtp_email: str, smtp_password: str):
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.smtp_email = smtp_email
+        self.smtp_password = smtp_password
+        self.server = None
+
+    def __enter__(self):
+        # Port 465 is implicit TLS: the handshake happens on connect, with no
+        # EHLO/STARTTLS round trip. Other ports (587) still upgrade in-band.
+        if self.smtp_port == 465:
+            self.server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port, timeout=SMTP_TIMEOUT)
+        else:
+            self.server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=SMTP_TIMEOUT)
+
+        # __exit__ does not run if __enter__ raises, so close the socket here
+        try:
+            if self.smtp_port != 465:
+                self.server.starttls()
+            self.server.login(self.smtp_email, self.smtp_password)
+        except Exception:
+            self.server.close()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # A dropped connection makes quit() raise OSError; don't let that
+        # mask the original exception, and always release the socket
+        try:
+            self.server.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        finally:
+            self.server.close()
+        return False
+
+    def send(self, msg):
+        """Send one message over the open connection."""
+        self.server.send_message(msg)
@@ -3,80 +3,116 @@
 Test script to demonstrate all 4 content types
 """
 
+import io
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 from dotenv import load_dotenv
-load_dotenv()
-
-print("=" * 70)
-print("TESTING ALL 4 CONTENT TYPES")
-print("=" * 70)
-print()
-
-# Test 1: Colleague Insight
-print("-" * 70)
-print("TEST 1: COLLEAGUE INSIGHT")
-print("-" * 70)
-from multi_mode_generator import generate_template_colleague_insight
-
-result1 = generate_template_colleague_insight(
-    colleague_name="Sarah Chen",
-    topic="prompt engineering",
-    what_you_learned="She showed me that writing prompts like explaining to an intern works better than giving instructions to a computer"
-)
-print(result1)
-print()
-
-# Test 2: Tech Perspective
-print("-" * 70)
-print("TEST 2: TECH PERSPECTIVE")
-print("-" * 70)
-from multi_mode_generator import generate_template_tech_perspective
-
-result2 = generate_template_tech_perspective(
-    technology="RAG systems",
-    experience_level="6 months in production",
-    perspective_focus="what papers don't tell you"
-)
-print(result2)
-print()
-
-# Test 3: Community Insight
-print("-" * 70)
-print("TEST 3: COMMUNITY INSIGHT")
-print("-" * 70)
-from multi_mode_generator import generate_template_community_insight
-
-result3 = generate_template_community_insight(
-    event="AI meetup",
-    topic="LLM deployment",
-    what_you_heard="Someone mentioned starting simple and iterating is better than planning everything upfront"
-)
-print(result3)
-print()
 
-# Test 4: Personal Experience
-print("-" * 70)
-print("TEST 4: PERSONAL EXPERIENCE")
-print("-" * 70)
+from multi_mode_generator import (
+    generate_all_modes_batch,
+    generate_template_colleague_insight,
+    generate_template_tech_perspective,
+    generate_template_community_insight,
+)
 from personal_story_generator import generate_template_personal_story
 
-result4 = generate_template_personal_story(
-    topic="A mistake I made with API rate limits",
-    story_type="challenge_overcome"
-)
-print(result4)
-print()
-
-print("=" * 70)
-print("ALL TESTS COMPLETE!")
-print("=" * 70)
-print()
-print("Summary:")
-print("- Colleague Insight: Generates posts that give credit to coworkers")
-print("- Tech Perspective: Shares your production experience")
-print("- Community Insight: Shows you're engaged in the community")
-print("- Personal Experience: Shares your own learnings")
-print()
-print("All modes working perfectly!")
-print()
-print("Ready to use!")
+# Sample inputs per mode, shared by the template and batched runs
+SAMPLE_INPUTS = {
+    "colleague": {
+        "colleague_name": "Sarah Chen",
+        "topic": "prompt engineering",
+        "what_you_learned": "She showed me that writing prompts like explaining to an intern works better than giving instructions to a computer"
+    },
+    "tech": {
+        "technology": "RAG systems",
+        "experience_level": "6 months in production",
+        "perspective_focus": "what papers don't tell you"
+    },
+    "community": {
+        "event": "AI meetup",
+        "topic": "LLM deployment",
+        "what_you_heard": "Someone mentioned starting simple and iterating is better than planning everything upfront"
+    },
+    "personal": {
+        "topic": "A mistake I made with API rate limits",
+        "story_type": "challenge_overcome"
+    },
+}
+
+
+def main():
+    """Generate one sample post per content type and print them."""
+    load_dotenv()
+
+    # Collect the report and write it out in one go
+    out = io.StringIO()
+
+    print("=" * 70, file=out)
+    print("TESTING ALL 4 CONTENT TYPES", file=out)
+    print("=" * 70, file=out)
+    print(file=out)
+
+    # The four modes are independent, so generate them concurrently and
+    # print the results in order
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        tests = [
+            ("TEST 1: COLLEAGUE INSIGHT", executor.submit(
+                generate_template_colleague_insight, **SAMPLE_INPUTS["colleague"]
+            )),
+            ("TEST 2: TECH PERSPECTIVE", executor.submit(
+                generate_template_tech_perspective, **SAMPLE_INPUTS["tech"]
+            )),
+            ("TEST 3: COMMUNITY INSIGHT", executor.submit(
+                generate_template_community_insight, **SAMPLE_INPUTS["community"]
+            )),
+            ("TEST 4: PERSONAL EXPERIENCE", executor.submit(
+                generate_template_personal_story, **SAMPLE_INPUTS["personal"]
+            )),
+        ]
+
+        for title, future in tests:
+            print("-" * 70, file=out)
+            print(title, file=out)
+            print("-" * 70, file=out)
+            print(future.result(), file=out)
+            print(file=out)
+
+    # With a Claude key, also generate all four modes in one API call and
+    # check that the response had a section for each of them
+    missing = []
+    if os.getenv("ANTHROPIC_API_KEY"):
+        results = generate_all_modes_batch(SAMPLE_INPUTS)
+        missing = [mode for mode in SAMPLE_INPUTS if mode not in results]
+
+        print("-" * 70, file=out)
+        print("TEST 5: ALL MODES IN ONE BATCHED CALL", file=out)
+        print("-" * 70, file=out)
+        for pack in results.values():
+            print(pack, file=out)
+            print(file=out)
+        if missing:
+            print(f"[!] Batched response had no section for: {', '.join(missing)}", file=out)
+            print(file=out)
+
+    print("=" * 70, file=out)
+    print("ALL TESTS COMPLETE!", file=out)
+    print("=" * 70, file=out)
+    print(file=out)
+    print("Summary:", file=out)
+    print("- Colleague Insight: Generates posts that give credit to coworkers", file=out)
+    print("- Tech Perspective: Shares your production experience", file=out)
+    print("- Community Insight: Shows you're engaged in the community", file=out)
+    print("- Personal Experience: Shares your own learnings", file=out)
+    print(file=out)
+    print("All modes working perfectly!", file=out)
+    print(file=out)
+    print("Ready to use!", file=out)
+
+    sys.stdout.write(out.getvalue())
+    return 1 if missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
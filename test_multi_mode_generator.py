@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for multi_mode_generator.split_batch_response()
+
+Run with pytest, or directly: python test_multi_mode_generator.py
+"""
+
+from multi_mode_generator import split_batch_response
+
+CANNED_RESPONSE = """=== MODE 1 COLLEAGUE ===
+Sarah showed me a better way to write prompts.
+
+=== MODE 2 TECH ===
+Six months of RAG in production taught me a lot.
+=== MODE 3 COMMUNITY ===
+At last night's meetup someone said: start simple.
+
+=== MODE 4 PERSONAL ===
+I once hit an API rate limit in production.
+"""
+
+
+def test_splits_every_marked_section():
+    posts = split_batch_response(CANNED_RESPONSE)
+    assert posts == {
+        "colleague": "Sarah showed me a better way to write prompts.",
+        "tech": "Six months of RAG in production taught me a lot.",
+        "community": "At last night's meetup someone said: start simple.",
+        "personal": "I once hit an API rate limit in production.",
+    }
+
+
+def test_ignores_preamble_before_first_marker():
+    posts = split_batch_response("Here are your posts:\n\n" + CANNED_RESPONSE)
+    assert set(posts) == {"colleague", "tech", "community", "personal"}
+    assert posts["colleague"] == "Sarah showed me a better way to write prompts."
+
+
+def test_missing_marker_drops_that_mode():
+    # The tech post runs into the colleague section instead of being lost
+    text = CANNED_RESPONSE.replace("=== MODE 2 TECH ===\n", "")
+    posts = split_batch_response(text)
+    assert set(posts) == {"colleague", "community", "personal"}
+    assert posts["colleague"].endswith("Six months of RAG in production taught me a lot.")
+
+
+def test_reworded_marker_is_not_matched():
+    text = CANNED_RESPONSE.replace("=== MODE 3 COMMUNITY ===", "=== MODE 3: COMMUNITY ===")
+    posts = split_batch_response(text)
+    assert "community" not in posts
+    assert posts["tech"].endswith("=== MODE 3: COMMUNITY ===\nAt last night's meetup someone said: start simple.")
+
+
+def test_no_markers():
+    assert split_batch_response("Just one post with no markers.") == {}
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"[+] {name}")
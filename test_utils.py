@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for utils.validate_url()
+
+Run with pytest, or directly: python test_utils.py
+"""
+
+from utils import validate_url
+
+# Accept/reject results of the original regex-based validate_url()
+REGEX_ACCEPTED = [
+    "http://example.com",
+    "https://example.com/",
+    "HTTP://EXAMPLE.COM",
+    "https://a.example.co.uk/path?x=1",
+    "http://example.museum",
+    "http://a-b.com",
+    "http://example.com:80",
+    "http://example.com:8080/path",
+    "http://example.com?x",
+    "http://example.com/#frag",
+]
+
+REGEX_REJECTED = [
+    "",
+    "example.com",
+    "ftp://example.com",
+    "http:/example.com",
+    "http://",
+    "http://.",
+    "http://a.",
+    "http://a..com",
+    "http://example.c",
+    "http://example.c0m",
+    "http://example.technology",
+    "http://example.com.",
+    "http://-a-.com",
+    "http://ex_ample.com",
+    "http://localhost",
+    "http://999.999.1.1",
+    "http://example.com:",
+    "http://example.com:abc",
+    "http://user@example.com",
+    "http://example.com#frag",
+    "http://example.com?",
+    "http://example.com/a b",
+    " http://example.com",
+    "\x00http://example.com",
+]
+
+
+def test_regex_accepted_urls_still_pass():
+    for url in REGEX_ACCEPTED:
+        assert validate_url(url), url
+
+
+def test_regex_rejected_urls_still_fail():
+    for url in REGEX_REJECTED:
+        assert not validate_url(url), url
+
+
+def test_ipv4_hosts():
+    # The old pattern's IP branch had a stray "\]", so it rejected every bare
+    # IPv4 host; real addresses are now accepted, invalid ones still are not
+    assert validate_url("http://1.2.3.4")
+    assert validate_url("http://192.168.0.1:8080/path")
+    assert not validate_url("http://256.1.1.1")
+    assert not validate_url("http://01.2.3.4")
+    assert not validate_url("http://1.2.3")
+
+
+def test_non_string_input():
+    assert not validate_url(None)
+    assert not validate_url(123)
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"[+] {name}")
@@ -8,6 +8,40 @@ LinkedIn has issues with certain Unicode characters:
 - Smart apostrophes need to be straight quotes
 """
 
+import re
+
+
+# Replace curly/smart quotes with straight quotes
+REPLACEMENTS = {
+    # Left and right single quotes
+    '\u2018': "'",  # '
+    '\u2019': "'",  # '
+    '\u201b': "'",  # '
+
+    # Left and right double quotes
+    '\u201c': '"',  # "
+    '\u201d': '"',  # "
+    '\u201f': '"',  # "
+
+    # Em dash and en dash
+    '\u2014': '--',  # — → --
+    '\u2013': '-',   # – → -
+
+    # Other problematic characters
+    '\u2026': '...',  # ellipsis …
+    '\u00a0': ' ',    # non-breaking space
+    '\u200b': '',     # zero-width space
+    '\u200c': '',     # zero-width non-joiner
+    '\u200d': '',     # zero-width joiner
+}
+
+# Single-pass translation table for all of the above
+_LINKEDIN_TRANS = str.maketrans(REPLACEMENTS)
+
+# Most posts contain none of these, so probe before building a new string.
+# Built from REPLACEMENTS so the probe and the table cannot drift apart.
+_BAD_RE = re.compile("[" + "".join(REPLACEMENTS) + "]")
+
 
 def sanitize_for_linkedin(text: str) -> str:
     """
@@ -19,34 +53,10 @@ def sanitize_for_linkedin(text: str) -> str:
     Returns:
         Sanitized text safe for LinkedIn
     """
-    # Replace curly/smart quotes with straight quotes
-    replacements = {
-        # Left and right single quotes
-        '\u2018': "'",  # '
-        '\u2019': "'",  # '
-        '\u201b': "'",  # '
-
-        # Left and right double quotes
-        '\u201c': '"',  # "
-        '\u201d': '"',  # "
-        '\u201f': '"',  # "
-
-        # Em dash and en dash
-        '\u2014': '--',  # — → --
-        '\u2013': '-',   # – → -
-
-        # Other problematic characters
-        '\u2026': '...',  # ellipsis …
-        '\u00a0': ' ',    # non-breaking space
-        '\u200b': '',     # zero-width space
-        '\u200c': '',     # zero-width non-joiner
-        '\u200d': '',     # zero-width joiner
-    }
-
-    for bad_char, good_char in replacements.items():
-        text = text.replace(bad_char, good_char)
-
-    return text
+    if not _BAD_RE.search(text):
+        return text
+
+    return text.translate(_LINKEDIN_TRANS)
 
 
 def demo_sanitizer():
@@ -3,9 +3,13 @@ Simple CLI tool to review and approve LinkedIn posts
 """
 
 import os
+import sys
 from dotenv import load_dotenv
 from datetime import datetime
 
+# Add parent directory to path to import from main package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 load_dotenv()
 
 try:
@@ -14,20 +18,33 @@ except ImportError:
     print("[!] notion-client not installed. Run: pip install notion-client")
     exit(1)
 
+from notion_helper import with_retry
+
+
+_NOTION = None
+
+
+def _client():
+    """Return the shared Notion client so calls reuse one connection."""
+    global _NOTION
+    if _NOTION is None:
+        _NOTION = Client(auth=os.getenv("NOTION_API_KEY"))
+    return _NOTION
+
 
 def get_pending_articles():
     """Get all articles with 'Draft' status from Notion."""
-    api_key = os.getenv("NOTION_API_KEY")
     database_id = os.getenv("NOTION_DATABASE_ID")
 
-    notion = Client(auth=api_key)
+    notion = _client()
 
     print("[*] Fetching pending articles from Notion...")
     print()
 
     try:
         # Query database for pages with Draft status
-        response = notion.databases.query(
+        response = with_retry(
+            notion.databases.query,
             database_id=database_id,
             filter={
                 "property": "Status",
@@ -90,11 +107,11 @@ def display_articles(pages):
 
 def approve_page(page_id: str):
     """Change page status to Approved."""
-    api_key = os.getenv("NOTION_API_KEY")
-    notion = Client(auth=api_key)
+    notion = _client()
 
     try:
-        notion.pages.update(
+        with_retry(
+            notion.pages.update,
             page_id=page_id,
             properties={
                 "Status": {
@@ -112,11 +129,10 @@ def approve_page(page_id: str):
 
 def delete_page(page_id: str):
     """Delete a page from Notion."""
-    api_key = os.getenv("NOTION_API_KEY")
-    notion = Client(auth=api_key)
+    notion = _client()
 
     try:
-        notion.pages.delete(page_id)
+        with_retry(notion.blocks.delete, block_id=page_id)
         return True
     except Exception as e:
         print(f"[!] Error deleting page: {e}")
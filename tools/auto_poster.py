@@ -4,6 +4,7 @@ Auto-Poster - Checks Notion for approved posts and posts to LinkedIn
 Designed to run once (not in a loop) for GitHub Actions
 """
 
+import asyncio
 import os
 import sys
 from notion_client import Client
@@ -15,6 +16,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 load_dotenv()
 
 from linkedin_integration import get_page_status, extract_linkedin_draft_from_notion, post_to_linkedin
+from notion_helper import query_database, with_retry
 
 notion_api_key = os.getenv('NOTION_API_KEY')
 database_id = os.getenv('NOTION_DATABASE_ID')
@@ -25,147 +27,177 @@ if not notion_api_key or not database_id:
 
 notion = Client(auth=notion_api_key)
 
+# Cap concurrent Notion requests well under the API's rate limit
+FETCH_CONCURRENCY = 8
+
+# Block types whose text lives in block[type]['rich_text']
+TEXT_BLOCK_TYPES = frozenset({
+    'paragraph', 'heading_1', 'heading_2', 'heading_3',
+    'bulleted_list_item', 'numbered_list_item', 'to_do',
+    'toggle', 'callout', 'quote', 'code'
+})
+
+# Only these block types get a second request for their children. Images,
+# embeds, synced blocks and column lists never hold draft text one level
+# down, so fetching their children would be a wasted round trip
+RECURSE_INTO_TYPES = TEXT_BLOCK_TYPES - {'code'}
+
+
+def block_text(block):
+    """Return the plain text of a block, or '' for non-text block types."""
+    block_type = block.get('type')
+    if block_type not in TEXT_BLOCK_TYPES:
+        return ''
+    rich_text = block.get(block_type, {}).get('rich_text', ())
+    return ''.join(t.get('plain_text', '') for t in rich_text)
+
+
+def fetch_page_text(page_id):
+    """Collect the plain text of a page's blocks (and one level of children)."""
+    page_content = with_retry(notion.blocks.children.list, block_id=page_id)
+    lines = []
+
+    for block in page_content.get('results', []):
+        text_content = block_text(block)
+        if text_content:
+            lines.append(text_content + '\n')
+
+        # If a text block has children, fetch them too
+        if block.get('has_children', False) and block.get('type') in RECURSE_INTO_TYPES:
+            try:
+                children = with_retry(notion.blocks.children.list, block_id=block.get('id'))
+                for child in children.get('results', []):
+                    child_text = block_text(child)
+                    if child_text:
+                        lines.append(child_text + '\n')
+            except Exception as e:
+                # Log but don't fail - child blocks are optional
+                print(f'[Warning] Failed to fetch child blocks: {e}', file=sys.stderr)
+
+    return ''.join(lines)
+
+
+async def fetch_all_page_texts(page_ids):
+    """
+    Fetch several pages' text concurrently, in the order given.
+
+    A page whose fetch fails gets its exception in place of the text, so one
+    bad page does not abort the others.
+    """
+    sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+    async def fetch(page_id):
+        async with sem:
+            return await asyncio.to_thread(fetch_page_text, page_id)
+
+    return await asyncio.gather(*(fetch(page_id) for page_id in page_ids), return_exceptions=True)
+
+
 print('[Auto-Poster] Checking for approved posts...')
 
-# Search for pages
-response = notion.search()
-all_pages = response.get('results', [])
-db_id_clean = database_id.replace('-', '')
+# Let Notion filter on Status when the property supports it; otherwise fall
+# back to every page in the database and check the status below
+status_type = with_retry(notion.databases.retrieve, database_id=database_id) \
+    .get('properties', {}).get('Status', {}).get('type')
+if status_type in ('status', 'select'):
+    query = {'filter': {'property': 'Status', status_type: {'equals': 'Approved'}}}
+else:
+    query = {}
 
-pages = [p for p in all_pages
-         if p.get('parent', {}).get('database_id', '').replace('-', '') == db_id_clean]
+pages = list(query_database(notion, database_id, **query))
+
+approved = [p for p in pages if get_page_status(p) == 'Approved']
+
+# Fetch every approved page's content up front; posting stays sequential
+# so LinkedIn sees one request at a time
+page_texts = asyncio.run(fetch_all_page_texts([p.get('id') for p in approved]))
 
 posted_count = 0
 
-for page in pages:
+for page, page_text in zip(approved, page_texts):
     page_id = page.get('id')
-    status = get_page_status(page)
 
-    # Skip already posted
-    if status == 'Posted':
+    # Get title dynamically
+    title = 'Unknown'
+    for prop_name, prop_data in page.get('properties', {}).items():
+        if prop_data.get('type') == 'title':
+            title_arr = prop_data.get('title', [])
+            if title_arr:
+                title = title_arr[0].get('plain_text', 'Unknown')
+            break
+
+    print(f'[Auto-Poster] Found approved post: {title}')
+
+    if isinstance(page_text, Exception):
+        print(f'[Auto-Poster] Failed to fetch page content: {page_text}')
+        print(f'[Auto-Poster] Continuing to next post...')
         continue
 
-    if status == 'Approved':
-        # Get title dynamically
-        title = 'Unknown'
-        for prop_name, prop_data in page.get('properties', {}).items():
-            if prop_data.get('type') == 'title':
-                title_arr = prop_data.get('title', [])
-                if title_arr:
-                    title = title_arr[0].get('plain_text', 'Unknown')
-                break
-
-        print(f'[Auto-Poster] Found approved post: {title}')
-
-        # Get content
-        page_content = notion.blocks.children.list(block_id=page_id)
-        page_text = ''
-
-        for block in page_content.get('results', []):
-            block_type = block.get('type')
-            has_children = block.get('has_children', False)
-
-            # Get all text from rich_text array (iterate all elements)
-            text_content = ''
-            if block_type in ['paragraph', 'heading_1', 'heading_2', 'heading_3',
-                              'bulleted_list_item', 'numbered_list_item', 'to_do',
-                              'toggle', 'callout', 'quote']:
-                rich_text = block.get(block_type, {}).get('rich_text', [])
-                for text_obj in rich_text:
-                    text_content += text_obj.get('plain_text', '')
-
-            elif block_type == 'code':
-                rich_text = block.get('code', {}).get('rich_text', [])
-                for text_obj in rich_text:
-                    text_content += text_obj.get('plain_text', '')
-
-            # Add to page_text
-            if text_content:
-                page_text += text_content + '\n'
-
-            # If block has children, fetch them too
-            if has_children:
-                try:
-                    children = notion.blocks.children.list(block_id=block.get('id'))
-                    for child in children.get('results', []):
-                        child_type = child.get('type')
-                        child_text = ''
-                        if child_type in ['paragraph', 'heading_1', 'heading_2', 'heading_3',
-                                          'bulleted_list_item', 'numbered_list_item']:
-                            # Fix: iterate all rich_text elements
-                            rich_text = child.get(child_type, {}).get('rich_text', [])
-                            for text_obj in rich_text:
-                                child_text += text_obj.get('plain_text', '')
-                        if child_text:
-                            page_text += child_text + '\n'
-                except Exception as e:
-                    # Log but don't fail - child blocks are optional
-                    import sys
-                    print(f'[Warning] Failed to fetch child blocks: {e}', file=sys.stderr)
-
-        # Extract draft with sanitization
-        draft = extract_linkedin_draft_from_notion(page_text)
-
-        if draft:
-            try:
-                print(f'[Auto-Poster] Posting to LinkedIn...')
-                post_url = post_to_linkedin(draft)
-
-                # Update Notion status (find status property dynamically)
-                status_prop = None
-                status_type = None
-                for prop_name, prop_data in page.get('properties', {}).items():
-                    if prop_data.get('type') in ['status', 'select']:
-                        # Prefer 'status' type over 'select'
-                        if status_type != 'status':
-                            status_prop = prop_name
-                            status_type = prop_data.get('type')
-                        if prop_data.get('type') == 'status':
-                            status_prop = prop_name
-                            status_type = 'status'
-                            break
-
-                if status_prop:
-                    if status_type == 'status':
-                        notion.pages.update(
-                            page_id=page_id,
-                            properties={
-                                status_prop: {
-                                    'status': {
-                                        'name': 'Posted'
-                                    }
+    # Extract draft with sanitization
+    draft = extract_linkedin_draft_from_notion(page_text)
+
+    if draft:
+        try:
+            print(f'[Auto-Poster] Posting to LinkedIn...')
+            post_url = post_to_linkedin(draft)
+
+            # Update Notion status (find status property dynamically)
+            status_prop = None
+            status_type = None
+            for prop_name, prop_data in page.get('properties', {}).items():
+                if prop_data.get('type') in ['status', 'select']:
+                    # Prefer 'status' type over 'select'
+                    if status_type != 'status':
+                        status_prop = prop_name
+                        status_type = prop_data.get('type')
+                    if prop_data.get('type') == 'status':
+                        status_prop = prop_name
+                        status_type = 'status'
+                        break
+
+            if status_prop:
+                if status_type == 'status':
+                    with_retry(
+                        notion.pages.update,
+                        page_id=page_id,
+                        properties={
+                            status_prop: {
+                                'status': {
+                                    'name': 'Posted'
                                 }
                             }
-                        )
-                    else:  # 'select' type
-                        notion.pages.update(
-                            page_id=page_id,
-                            properties={
-                                status_prop: {
-                                    'select': {
-                                        'name': 'Posted'
-                                    }
+                        }
+                    )
+                else:  # 'select' type
+                    with_retry(
+                        notion.pages.update,
+                        page_id=page_id,
+                        properties={
+                            status_prop: {
+                                'select': {
+                                    'name': 'Posted'
                                 }
                             }
-                        )
-                else:
-                    print('[Warning] No status property found, cannot update')
+                        }
+                    )
+            else:
+                print('[Warning] No status property found, cannot update')
 
-                print(f'[Auto-Poster] Successfully posted!')
-                print(f'[Auto-Poster] Post URL: {post_url}')
-                posted_count += 1
+            print(f'[Auto-Poster] Successfully posted!')
+            print(f'[Auto-Poster] Post URL: {post_url}')
+            posted_count += 1
 
-            except Exception as e:
-                print(f'[Auto-Poster] Failed to post: {e}')
-                print(f'[Auto-Poster] Continuing to next post...')
-        else:
-            print(f'[Auto-Poster] No LinkedIn draft found')
+        except Exception as e:
+            print(f'[Auto-Poster] Failed to post: {e}')
+            print(f'[Auto-Poster] Continuing to next post...')
+    else:
+        print(f'[Auto-Poster] No LinkedIn draft found')
 
 print(f'[Auto-Poster] Posted {posted_count} post(s)')
 
 # Exit with error if no posts were made but there were approved items
 if posted_count == 0:
-    approved_count = sum(1 for p in pages if get_page_status(p) == 'Approved')
+    approved_count = len(approved)
     if approved_count > 0:
         print(f'[Auto-Poster] Warning: {approved_count} approved post(s) could not be posted')
         sys.exit(1)
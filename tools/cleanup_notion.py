@@ -12,12 +12,28 @@ Usage:
 
 import os
 import sys
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
 from notion_client import Client
 from dotenv import load_dotenv
 
+# Add parent directory to path to import from main package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from notion_helper import query_database, with_retry
+
 load_dotenv()
 
+# Deletes run in parallel but stay under Notion's ~3 requests/second limit
+DELETE_WORKERS = 5
+NOTION_REQUESTS_PER_SECOND = 3
+
+# Fields read from a page once, then reused for the listing and the deletes
+PageInfo = namedtuple('PageInfo', 'id title status created age_days')
+
 
 def cleanup_notion(days_old=30, status=None, dry_run=True):
     """
@@ -48,70 +64,68 @@ def cleanup_notion(days_old=30, status=None, dry_run=True):
         print(f"    Current date: {datetime.now().strftime('%Y-%m-%d')}")
         print()
 
-        # Search for pages in the database
-        print("[*] Searching Notion database...")
-        response = notion.search()
-        all_pages = response.get('results', [])
-        print(f"[*] Notion search returned {len(all_pages)} total items")
-
-        db_id_clean = database_id.replace('-', '')
-        print(f"[*] Looking for database ID: {db_id_clean}")
-
-        # Filter pages from our database
-        pages = [p for p in all_pages
-                 if p.get('parent', {}).get('database_id', '').replace('-', '') == db_id_clean]
-
-        print(f"[+] Found {len(pages)} total pages in target database\n")
-
-        # Calculate cutoff date
-        cutoff_date = datetime.now() - timedelta(days=days_old)
+        # Only fetch pages created before the cutoff; status is still checked
+        # below since old "junk" pages are deleted regardless of the filter
+        print("[*] Querying Notion database...")
+        now_utc = datetime.now(timezone.utc)
+        cutoff_utc = now_utc - timedelta(days=days_old)
+        # Notion timestamps are UTC RFC 3339 strings in this exact format, so
+        # they compare chronologically as plain strings
+        cutoff_iso = cutoff_utc.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+        pages = list(query_database(
+            notion,
+            database_id,
+            filter={"timestamp": "created_time", "created_time": {"before": cutoff_utc.isoformat()}}
+        ))
+
+        print(f"[+] Found {len(pages)} pages older than {days_old} days in target database\n")
         pages_to_delete = []
 
         for page in pages:
-            page_id = page.get('id')
             created_time = page.get('created_time')
-            page_status = get_page_status(page)
-            title_obj = page.get('properties', {}).get('Title', {}).get('title', [])
-            title = title_obj[0].get('plain_text', 'Unknown') if title_obj else 'Unknown'
-
-            # Parse created time and remove timezone info for comparison
-            try:
-                created_date = datetime.fromisoformat(created_time.replace('Z', '+00:00'))
-                # Remove timezone info to make comparison work
-                created_date = created_date.replace(tzinfo=None)
-            except:
+            if not created_time:
                 continue
 
             # Check if page matches criteria
-            matches_age = created_date < cutoff_date
+            matches_age = created_time < cutoff_iso
+            if not matches_age:
+                continue
+
+            page_status = get_page_status(page)
             matches_status = status is None or page_status == status
 
             # Also check for specific statuses that indicate "junk"
             # e.g., "Not Reviewed" articles that are old
-            is_junk = page_status in ["Not Reviewed", "Draft", None] and matches_age
-
-            if matches_age and (matches_status or is_junk):
-                pages_to_delete.append({
-                    'id': page_id,
-                    'title': title,
-                    'status': page_status,
-                    'created': created_date,
-                    'age_days': (datetime.now() - created_date).days
-                })
+            is_junk = page_status in ["Not Reviewed", "Draft", None]
+
+            if matches_status or is_junk:
+                # Only pages being deleted need a real datetime for display
+                try:
+                    created_date = datetime.fromisoformat(created_time.replace('Z', '+00:00'))
+                except ValueError:
+                    continue
+
+                pages_to_delete.append(PageInfo(
+                    id=page.get('id'),
+                    title=get_page_title(page),
+                    status=page_status,
+                    created=created_date,
+                    age_days=(now_utc - created_date).days
+                ))
 
         if not pages_to_delete:
             print("[*] No pages to delete. Database is clean!")
             print(f"[*] Checked {len(pages)} pages, none matched deletion criteria")
-            print(f"[*] Cutoff date: {cutoff_date.strftime('%Y-%m-%d')}")
+            print(f"[*] Cutoff date: {cutoff_utc.strftime('%Y-%m-%d')}")
             return 0
 
         # Show pages that would be deleted
         print(f"[*] Found {len(pages_to_delete)} page(s) to delete:\n")
         for i, page in enumerate(pages_to_delete, 1):
-            print(f"  {i}. {page['title']}")
-            print(f"     Status: {page['status'] or 'No status'}")
-            print(f"     Created: {page['created'].strftime('%Y-%m-%d')}")
-            print(f"     Age: {page['age_days']} days")
+            print(f"  {i}. {page.title}")
+            print(f"     Status: {page.status or 'No status'}")
+            print(f"     Created: {page.created.strftime('%Y-%m-%d')}")
+            print(f"     Age: {page.age_days} days")
             print()
 
         # Confirm deletion
@@ -135,13 +149,22 @@ def cleanup_notion(days_old=30, status=None, dry_run=True):
         print(f"\n[*] Deleting {len(pages_to_delete)} pages...")
         deleted_count = 0
 
-        for page in pages_to_delete:
-            try:
-                notion.blocks.delete(block_id=page['id'])
-                deleted_count += 1
-                print(f"  [+] Deleted: {page['title'][:50]}...")
-            except Exception as e:
-                print(f"  [!] Failed to delete {page['title']}: {e}")
+        wait_for_slot = rate_limiter(NOTION_REQUESTS_PER_SECOND)
+
+        def delete_page(page):
+            wait_for_slot()
+            with_retry(notion.blocks.delete, block_id=page.id)
+
+        with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+            futures = {executor.submit(delete_page, page): page for page in pages_to_delete}
+            for future in as_completed(futures):
+                page = futures[future]
+                try:
+                    future.result()
+                    deleted_count += 1
+                    print(f"  [+] Deleted: {page.title[:50]}...")
+                except Exception as e:
+                    print(f"  [!] Failed to delete {page.title}: {e}")
 
         print(f"\n[+] Successfully deleted {deleted_count}/{len(pages_to_delete)} pages")
         return 0
@@ -153,6 +176,32 @@ def cleanup_notion(days_old=30, status=None, dry_run=True):
         return 1
 
 
+def rate_limiter(max_per_second):
+    """
+    Build a sliding-window limiter shared by several threads.
+
+    Args:
+        max_per_second: Maximum calls allowed in any one-second window
+
+    Returns:
+        Function that blocks until the caller may make its request
+    """
+    lock = threading.Lock()
+    recent = deque()
+
+    def wait_for_slot():
+        with lock:
+            now = time.monotonic()
+            while recent and now - recent[0] >= 1:
+                recent.popleft()
+            if len(recent) >= max_per_second:
+                time.sleep(1 - (now - recent.popleft()))
+                now = time.monotonic()
+            recent.append(now)
+
+    return wait_for_slot
+
+
 def get_page_status(page):
     """Extract status from Notion page."""
     status_prop = page.get('properties', {}).get('Status', {})
@@ -161,6 +210,12 @@ def get_page_status(page):
     return ''
 
 
+def get_page_title(page):
+    """Extract the Title property's plain text from a Notion page."""
+    title_obj = page.get('properties', {}).get('Title', {}).get('title', [])
+    return title_obj[0].get('plain_text', 'Unknown') if title_obj else 'Unknown'
+
+
 def interactive_mode():
     """Interactive mode for cleanup."""
     print("\n" + "=" * 60)
@@ -8,6 +8,11 @@ import sys
 from notion_client import Client
 from dotenv import load_dotenv
 
+# Add parent directory to path to import from main package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from notion_helper import search_pages
+
 load_dotenv()
 
 notion_api_key = os.getenv('NOTION_API_KEY')
@@ -21,12 +26,10 @@ notion = Client(auth=notion_api_key)
 
 print('[*] Searching for pages in your database...')
 
-# Search for pages
-response = notion.search()
-all_pages = response.get('results', [])
+# Search for pages (every result page, databases excluded)
 db_id_clean = database_id.replace('-', '')
 
-pages = [p for p in all_pages
+pages = [p for p in search_pages(notion)
          if p.get('parent', {}).get('database_id', '').replace('-', '') == db_id_clean]
 
 print(f'[+] Found {len(pages)} pages\n')
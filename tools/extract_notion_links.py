@@ -2,38 +2,55 @@
 Extract Notion links from curator output for GitHub Actions
 """
 
+import os
 import re
 import sys
 
-def extract_links():
-    with open('generation.log', 'r') as f:
-        content = f.read()
+_NOTION_URL_RE = re.compile(r'https://www\.notion\.so/[^\s]+')
+
+# Logs past this size point at a runaway generation; still scanned, but flagged
+LOG_SIZE_WARNING = 100 * 1024 * 1024  # bytes
 
-    # Extract Notion URLs
-    urls = re.findall(r'https://www\.notion\.so/[^\s]+', content)
 
-    if not urls:
+def extract_links():
+    log_size = os.stat('generation.log').st_size
+    if log_size > LOG_SIZE_WARNING:
+        print(f'[!] generation.log is {log_size // (1024 * 1024)} MB, scanning line by line')
+
+    # One pass: scan the log line by line, keeping only the unique URLs in
+    # memory in first-seen order
+    seen = set()
+    unique_urls = []
+    total = 0
+    with open('generation.log', 'r') as log:
+        for line in log:
+            for match in _NOTION_URL_RE.finditer(line):
+                url = match.group()
+                total += 1
+                if url not in seen:
+                    seen.add(url)
+                    unique_urls.append(url)
+
+    if not unique_urls:
         print('No Notion URLs found')
         sys.exit(1)
 
-    # Deduplicate URLs while preserving order
-    unique_urls = list(dict.fromkeys(urls))
+    # Only written on success, so a failed run leaves no empty file behind
+    with open('notion_links.txt', 'w') as out:
+        out.write('\n'.join(unique_urls) + '\n')
 
-    print(f'Found {len(urls)} Notion pages ({len(unique_urls)} unique)')
+    print(f'Found {total} Notion pages ({len(unique_urls)} unique)')
 
-    # Save unique URLs to file
-    with open('notion_links.txt', 'w') as f:
-        for url in unique_urls:
-            f.write(url + '\n')
-
-    # Set GitHub output (for next steps)
+    # Set GitHub output (for next steps) as a multiline value, one URL per line
     output_file = os.environ.get('GITHUB_OUTPUT')
     if output_file:
         with open(output_file, 'a') as f:
-            f.write(f'urls={urls}\n')
+            f.write('urls<<EOF\n')
+            f.write('\n'.join(unique_urls))
+            f.write('\nEOF\n')
+
+    return unique_urls
 
-    return urls
 
 if __name__ == "__main__":
-    import os
     extract_links()
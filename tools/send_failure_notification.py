@@ -2,32 +2,22 @@
 Send failure notification for GitHub Actions
 """
 import os
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import sys
+from email.message import EmailMessage
 from datetime import datetime
 from dotenv import load_dotenv
 
-load_dotenv()
+# Add parent directory to path to import from main package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from smtp_notifier import Notifier
 
-def send_failure_notification(workflow_name: str, error_message: str = ""):
-    """Send email notification when workflow fails."""
-    # Check if email is configured
-    smtp_email = os.getenv('SMTP_EMAIL')
-    smtp_password = os.getenv('SMTP_PASSWORD')
-
-    if not smtp_email or not smtp_password:
-        print('[*] Email not configured, skipping failure notification')
-        return 0
+load_dotenv()
 
-    # SMTP configuration
-    smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
-    smtp_port = int(os.getenv('SMTP_PORT', '587'))
-    recipient = os.getenv('NOTIFICATION_EMAIL', smtp_email)
 
-    # Create email
-    msg = MIMEMultipart()
+def build_failure_message(workflow_name: str, error_message: str, smtp_email: str, recipient: str):
+    """Build the failure alert email for one workflow."""
+    msg = EmailMessage()
     msg['Subject'] = f'❌ FAILED: {workflow_name} - {datetime.now().strftime("%Y-%m-%d %H:%M")}'
     msg['From'] = smtp_email
     msg['To'] = recipient
@@ -57,17 +47,34 @@ https://github.com/YOUR_USERNAME/YOUR_REPO/actions
 Don't worry, this happens! Just check the logs and fix it.
 '''
 
-    msg.attach(MIMEText(body, 'plain'))
+    msg.set_content(body)
+    return msg
+
+
+def send_failure_notifications(failures: list[tuple[str, str]]):
+    """
+    Send one failure email per (workflow_name, error_message) pair over a
+    single SMTP connection.
+    """
+    # Check if email is configured
+    smtp_email = os.getenv('SMTP_EMAIL')
+    smtp_password = os.getenv('SMTP_PASSWORD')
+
+    if not smtp_email or not smtp_password:
+        print('[*] Email not configured, skipping failure notification')
+        return 0
+
+    # SMTP configuration
+    smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
+    smtp_port = int(os.getenv('SMTP_PORT') or '465')
+    recipient = os.getenv('NOTIFICATION_EMAIL', smtp_email)
 
     # Send email
     try:
-        server = smtplib.SMTP(smtp_server, smtp_port)
-        server.starttls()
-        server.login(smtp_email, smtp_password)
-        server.send_message(msg)
-        server.quit()
-
-        print(f'[+] Failure notification sent to {recipient}')
+        with Notifier(smtp_server, smtp_port, smtp_email, smtp_password) as notifier:
+            for workflow_name, error_message in failures:
+                notifier.send(build_failure_message(workflow_name, error_message, smtp_email, recipient))
+                print(f'[+] Failure notification sent to {recipient}')
         return 0
 
     except Exception as e:
@@ -75,9 +82,12 @@ Don't worry, this happens! Just check the logs and fix it.
         return 1
 
 
-if __name__ == "__main__":
-    import sys
+def send_failure_notification(workflow_name: str, error_message: str = ""):
+    """Send email notification when workflow fails."""
+    return send_failure_notifications([(workflow_name, error_message)])
 
+
+if __name__ == "__main__":
     workflow_name = sys.argv[1] if len(sys.argv) > 1 else "GitHub Actions Workflow"
     error_msg = sys.argv[2] if len(sys.argv) > 2 else ""
 
@@ -4,15 +4,48 @@ Send email notification for GitHub Actions
 
 import os
 import smtplib
+import string
+import sys
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
 from dotenv import load_dotenv
 
+# Add parent directory to path to import from main package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from smtp_notifier import Notifier
+
 load_dotenv()
 
+# Static text of the review email, built once; only the counts, timestamp
+# and article list are filled in per run
+_BODY_TEMPLATE = string.Template('''
+$count new LinkedIn article$plural ready for your review (mix of technical + general).
 
-def send_notification():
+Generated: $generated
+
+ARTICLES TO REVIEW:
+============================================================
+$articles
+============================================================
+
+NEXT STEPS:
+1. Click each link to review the article in Notion
+2. Keep the ones you like, delete the others
+3. Change status to "Approved" for articles you want to post
+4. Auto-poster will post them to LinkedIn
+
+Or run locally: python approve.py
+''')
+
+
+def send_notifications(recipients: list[str]):
+    """
+    Send the review email to each recipient over a single SMTP connection.
+
+    Falls back to SMTP_EMAIL when no recipients are given.
+    """
     # Check if email is configured
     smtp_email = os.getenv('SMTP_EMAIL')
     smtp_password = os.getenv('SMTP_PASSWORD')
@@ -24,8 +57,9 @@ def send_notification():
 
     # Read URLs
     try:
-        with open('notion_links.txt', 'r') as f:
-            urls = [line.strip() for line in f if line.strip()]
+        # Large read buffer, and each line stripped once rather than twice
+        with open('notion_links.txt', 'r', buffering=1 << 16) as f:
+            urls = [line for line in map(str.strip, f) if line]
     except FileNotFoundError:
         print('[*] No notion_links.txt file found')
         return 0
@@ -36,52 +70,36 @@ def send_notification():
 
     # SMTP configuration
     smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
-    smtp_port = int(os.getenv('SMTP_PORT', '587'))
-    recipient = os.getenv('NOTIFICATION_EMAIL', smtp_email)
+    smtp_port = int(os.getenv('SMTP_PORT') or '465')
+    recipients = recipients or [smtp_email]
 
     # Create email
     article_count = len(urls)
-    msg = MIMEMultipart()
-    msg['Subject'] = f'{article_count} LinkedIn Articles Ready for Review - {datetime.now().strftime("%Y-%m-%d")}'
-    msg['From'] = smtp_email
-    msg['To'] = recipient
+    now = datetime.now()
+    subject = f'{article_count} LinkedIn Articles Ready for Review - {now:%Y-%m-%d}'
 
-    # Email body
-    body = f'''
-{article_count} new LinkedIn article{"s" if article_count != 1 else ""} ready for your review (mix of technical + general).
+    # Email body, with the article list built in one join
+    article_lines = ''.join(f'\n{i}. {url}\n' for i, url in enumerate(urls, 1))
 
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
+    body = _BODY_TEMPLATE.substitute(
+        count=article_count,
+        plural='s' if article_count != 1 else '',
+        generated=f'{now:%Y-%m-%d %H:%M}',
+        articles=article_lines
+    )
 
-ARTICLES TO REVIEW:
-{'=' * 60}
-'''
-
-    for i, url in enumerate(urls, 1):
-        body += f'\n{i}. {url}\n'
-
-    body += f'''
-{'=' * 60}
-
-NEXT STEPS:
-1. Click each link to review the article in Notion
-2. Keep the ones you like, delete the others
-3. Change status to "Approved" for articles you want to post
-4. Auto-poster will post them to LinkedIn
-
-Or run locally: python approve.py
-'''
-
-    msg.attach(MIMEText(body, 'plain'))
-
-    # Send email
+    # Send email, logging in once for all recipients
     try:
-        # Use context manager for automatic cleanup and add timeout
-        with smtplib.SMTP(smtp_server, smtp_port, timeout=30) as server:
-            server.starttls()
-            server.login(smtp_email, smtp_password)
-            server.send_message(msg)
+        with Notifier(smtp_server, smtp_port, smtp_email, smtp_password) as notifier:
+            for recipient in recipients:
+                msg = MIMEMultipart()
+                msg['Subject'] = subject
+                msg['From'] = smtp_email
+                msg['To'] = recipient
+                msg.attach(MIMEText(body, 'plain'))
+                notifier.send(msg)
+                print(f'[+] Email notification sent to {recipient}')
 
-        print(f'[+] Email notification sent to {recipient}')
         print(f'    {len(urls)} articles ready for review')
         return 0
 
@@ -96,6 +114,11 @@ Or run locally: python approve.py
         return 1
 
 
+def send_notification():
+    """Send the review email to NOTIFICATION_EMAIL (defaults to SMTP_EMAIL)."""
+    recipient = os.getenv('NOTIFICATION_EMAIL')
+    return send_notifications([recipient] if recipient is not None else [])
+
+
 if __name__ == "__main__":
-    import sys
     sys.exit(send_notification())
@@ -3,8 +3,33 @@ Utility functions for text sanitization and validation.
 """
 
 import html
+import ipaddress
 import re
 from typing import Optional
+from urllib.parse import urlsplit
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Anything the full sanitize pipeline would change besides whitespace: tag
+# brackets, characters html.escape() rewrites, and dropped control characters
+_NEEDS_CLEANUP_RE = re.compile(r'[<>&"\'\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# Control characters to drop, keeping tab, newline and carriage return
+_CTRL_DELETE = dict.fromkeys(c for c in range(32) if c not in (9, 10, 13))
+
+# A draft starts after the "LINKEDIN POST:" header and runs up to the next
+# section header (or the end of the page). Finding the two ends separately
+# avoids a lazy .*? that re-tries the lookahead at every character
+_DRAFT_HEADER_RE = re.compile(r'LINKEDIN POST\s*:?\s*\n', re.IGNORECASE)
+_DRAFT_END_RE = re.compile(
+    r'\n\n(?:ARTICLE \d+|WHY THIS MATTERS|Article Details|OPTION)',
+    re.IGNORECASE
+)
+
+# Host name parts for validate_url(): each dot-separated label is 1-63
+# letters, digits or inner hyphens, and the TLD is 2-6 letters
+_HOST_LABEL_RE = re.compile(r'[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?', re.IGNORECASE)
+_TLD_RE = re.compile(r'[A-Z]{2,6}', re.IGNORECASE)
 
 
 def sanitize_text(text: str, max_length: int = 3000) -> str:
@@ -24,17 +49,28 @@ def sanitize_text(text: str, max_length: int = 3000) -> str:
     if not text:
         return ""
 
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-
-    # HTML escape any remaining special characters
-    text = html.escape(text)
-
-    # Remove control characters (except newline, tab, carriage return)
-    text = ''.join(char for char in text if ord(char) >= 32 or char in '\n\r\t')
-
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    # Plain text, the usual case for drafts read back from Notion, only
+    # needs its whitespace normalized
+    needs_cleanup = _NEEDS_CLEANUP_RE.search(text) is not None
+
+    # Remove HTML tags and control characters (except newline, tab,
+    # carriage return)
+    if needs_cleanup:
+        text = _HTML_TAG_RE.sub('', text).translate(_CTRL_DELETE)
+
+    # Normalize whitespace (str.split() uses the same whitespace set as \s).
+    # For long inputs, collapse a bounded prefix first: if that alone
+    # overflows max_length, the rest would be truncated away anyway
+    collapsed = ' '.join(text[:max_length * 2].split())
+    if len(text) > max_length * 2 and len(collapsed) <= max_length:
+        collapsed = ' '.join(text.split())
+    text = collapsed
+
+    # HTML escape any remaining special characters. Escaping never adds
+    # whitespace or control characters, so it runs once on the already
+    # shortened text
+    if needs_cleanup:
+        text = html.escape(text)
 
     # Truncate if too long
     if len(text) > max_length:
@@ -53,24 +89,16 @@ def extract_linkedin_draft_safe(page_text: str) -> Optional[str]:
     Returns:
         Sanitized LinkedIn draft text, or None if not found
     """
-    # Find all "LINKEDIN POST:" sections (case-insensitive)
-    import re
-    pattern = r'LINKEDIN POST\s*:?\s*\n(.*?)(?=\n\n(?:ARTICLE \d+|WHY THIS MATTERS|Article Details|OPTION)|\Z)'
-    matches = re.findall(pattern, page_text, re.DOTALL | re.IGNORECASE)
-
-    if matches:
-        draft = matches[0].strip()
+    # Find the first "LINKEDIN POST:" section (case-insensitive)
+    header = _DRAFT_HEADER_RE.search(page_text)
 
-        # Clean up metadata lines
-        lines = draft.split('\n')
-        clean_lines = []
-        for line in lines:
-            line = line.strip()
-            # Skip metadata lines
-            if line and not line.startswith('Article') and not line.startswith('http'):
-                clean_lines.append(line)
+    if header:
+        end = _DRAFT_END_RE.search(page_text, header.end())
+        draft = page_text[header.end():end.start() if end else len(page_text)].strip()
 
-        draft = '\n'.join(clean_lines).strip()
+        # Clean up metadata lines (article details and bare URLs)
+        draft = '\n'.join(line for line in (raw.strip() for raw in draft.splitlines())
+                          if line and not line.startswith(('Article', 'http')))
 
         # Sanitize before returning
         return sanitize_text(draft, max_length=3000)
@@ -88,16 +116,39 @@ def validate_url(url: str) -> bool:
     Returns:
         True if URL appears valid, False otherwise
     """
-    if not url or not isinstance(url, str):
+    if not url or not isinstance(url, str) or any(c.isspace() for c in url):
         return False
 
-    # Basic URL validation
-    url_pattern = re.compile(
-        r'^https?://'  # http or https
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}'  # domain
-        r'|\[?\d{1,3}\]?\.\d{1,3}\.\d{1,3}\.\d{1,3}\])'  # or IP
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE
-    )
+    # Structural parse instead of a backtracking regex
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return False
 
-    return bool(url_pattern.match(url))
+    prefix = parts.scheme + '://'
+    if parts.scheme not in ('http', 'https') or url[:len(prefix)].lower() != prefix:
+        return False
+
+    # After the host, only nothing, "/", or a "/..." path or "?..." query
+    rest = url[len(prefix) + len(parts.netloc):]
+    if rest not in ('', '/') and (rest[0] not in '/?' or len(rest) < 2):
+        return False
+
+    # host[:port], with no user info
+    host, has_port, port = parts.netloc.partition(':')
+    if has_port and not (port.isascii() and port.isdigit()):
+        return False
+
+    labels = host.split('.')
+    if len(labels) == 4 and all(label.isascii() and label.isdigit() for label in labels):
+        try:
+            ipaddress.IPv4Address(host)
+        except ValueError:
+            return False
+        return True
+
+    return (
+        len(labels) >= 2
+        and all(_HOST_LABEL_RE.fullmatch(label) for label in labels[:-1])
+        and _TLD_RE.fullmatch(labels[-1]) is not None
+    )